@@ -2,11 +2,12 @@ from .brain import (
     AdaptiveLighting,
     calculate_dimming_step,
     get_adaptive_lighting,
+    get_adaptive_lighting_batch,
 )
 
 __all__ = [
     "AdaptiveLighting",
     "calculate_dimming_step",
     "get_adaptive_lighting",
+    "get_adaptive_lighting_batch",
 ]
-
@@ -14,8 +14,9 @@ from __future__ import annotations
 import math
 import os
 import logging
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple, Any
+from typing import Dict, List, Optional, Sequence, Tuple, Any
 from enum import Enum
 
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError  # stdlib ≥3.9
@@ -735,14 +736,58 @@ def calculate_dimming_step(
     now = current_time.astimezone(tzinfo) if tzinfo else current_time
 
     loc = LocationInfo(latitude=latitude, longitude=longitude, timezone=tzinfo or "UTC")
-    observer = loc.observer
-    solar_events = sun(observer, date=now.date(), tzinfo=loc.timezone)
+    al = _build_adaptive_lighting(
+        loc.observer, now, loc.timezone,
+        min_color_temp, max_color_temp, min_brightness, max_brightness, config,
+    )
+    
+    # Calculate the step target
+    target_time, lighting_values = al.calculate_step_target(now, action, max_steps)
+    
+    # Calculate time offset in minutes
+    time_offset_minutes = (target_time - now).total_seconds() / 60
     
-    # Calculate solar midnight
+    # Lazy %-formatting: these run on every step press with DEBUG normally off
+    logger.debug("Dimming step: %s from %s to %s", action, now, target_time)
+    logger.debug("Target values: %sK, %s%%", lighting_values['kelvin'], lighting_values['brightness'])
+    
+    return {
+        **lighting_values,
+        'time_offset_minutes': time_offset_minutes,
+        'target_time': target_time
+    }
+
+@lru_cache(maxsize=64)
+def _solar_events(latitude: float, longitude: float, tzinfo, day) -> Dict[str, datetime]:
+    """Return astral's solar events for one location and calendar day.
+
+    sun() is by far the most expensive call on the adaptive-lighting path and
+    only depends on the location and date, so repeated lookups for the same
+    day (periodic updates, dimming steps) are served from this cache.
+    Callers must treat the returned dict as read-only.
+    """
+    observer = LocationInfo(latitude=latitude, longitude=longitude).observer
+    return sun(observer, date=day, tzinfo=tzinfo)
+
+
+def _build_adaptive_lighting(
+    observer,
+    now: datetime,
+    tzinfo,
+    min_color_temp: int,
+    max_color_temp: int,
+    min_brightness: int,
+    max_brightness: int,
+    config: Optional[Dict[str, Any]],
+) -> AdaptiveLighting:
+    """Build the adaptive-lighting curve for the calendar day of *now*."""
+    solar_events = _solar_events(observer.latitude, observer.longitude, tzinfo, now.date())
+
+    # Calculate solar midnight (opposite of solar noon)
     solar_noon = solar_events["noon"]
     solar_midnight = solar_noon - timedelta(hours=12) if solar_noon.hour >= 12 else solar_noon + timedelta(hours=12)
 
-    # Prepare curve parameters from config
+    # Prepare curve parameters (use provided config or defaults)
     kwargs = {
         "min_color_temp": min_color_temp,
         "max_color_temp": max_color_temp,
@@ -753,8 +798,8 @@ def calculate_dimming_step(
         "solar_noon": solar_noon,
         "solar_midnight": solar_midnight,
     }
-    
-    # Add simplified curve parameters from config if provided
+
+    # Add simplified parameters from config if provided
     if config:
         for key in ["mid_bri_up", "steep_bri_up", "mid_cct_up", "steep_cct_up",
                    "mid_bri_dn", "steep_bri_dn", "mid_cct_dn", "steep_cct_dn",
@@ -762,22 +807,34 @@ def calculate_dimming_step(
             if key in config:
                 kwargs[key] = config[key]
 
-    al = AdaptiveLighting(**kwargs)
-    
-    # Calculate the step target
-    target_time, lighting_values = al.calculate_step_target(now, action, max_steps)
-    
-    # Calculate time offset in minutes
-    time_offset_minutes = (target_time - now).total_seconds() / 60
-    
-    logger.debug(f"Dimming step: {action} from {now.isoformat()} to {target_time.isoformat()}")
-    logger.debug(f"Target values: {lighting_values['kelvin']}K, {lighting_values['brightness']}%")
-    
-    return {
-        **lighting_values,
-        'time_offset_minutes': time_offset_minutes,
-        'target_time': target_time
+    return AdaptiveLighting(**kwargs)
+
+
+def _evaluate_adaptive_lighting(al: AdaptiveLighting, observer, now: datetime) -> Tuple[Dict[str, Any], float]:
+    """Sample *al* at *now*, returning the lighting values and the raw solar elevation."""
+    elev = solar_elevation(observer, now)
+    sun_pos = al.calculate_sun_position(now, elev)
+    solar_time = al.get_solar_time(now)
+
+    # Use simplified curve methods
+    cct = al.calculate_color_temperature(now)
+    bri = al.calculate_brightness(now)
+
+    # Calculate all color representations
+    rgb = al.color_temperature_to_rgb(cct)
+    xy_from_kelvin = al.color_temperature_to_xy(cct)
+
+    values = {
+        "color_temp": cct,  # Keep for backwards compatibility
+        "kelvin": cct,
+        "brightness": bri,
+        "rgb": rgb,
+        "xy": xy_from_kelvin,  # Use direct kelvin->xy conversion
+        "sun_position": sun_pos,
+        "solar_time": solar_time,
     }
+    return values, elev
+
 
 def get_adaptive_lighting(
     *,
@@ -826,59 +883,76 @@ def get_adaptive_lighting(
 
     loc = LocationInfo(latitude=latitude, longitude=longitude, timezone=tzinfo or "UTC")
     observer = loc.observer
-    solar_events = sun(observer, date=now.date(), tzinfo=loc.timezone)
-    elev = solar_elevation(observer, now)
+    al = _build_adaptive_lighting(
+        observer, now, loc.timezone,
+        min_color_temp, max_color_temp, min_brightness, max_brightness, config,
+    )
+    values, elev = _evaluate_adaptive_lighting(al, observer, now)
+    cct = values["kelvin"]
+    bri = values["brightness"]
+    rgb = values["rgb"]
+    xy_from_kelvin = values["xy"]
+    solar_time = values["solar_time"]
+
+    logger.info(
+        "%s – elev %.1f°, solar_time %.2fh | lighting: %sK/%s%%",
+        now, elev, solar_time, cct, bri,
+    )
+    
+    # Log color information
+    logger.info(
+        "Color values: %sK, RGB(%s, %s, %s), XY(%.4f, %.4f)",
+        cct, rgb[0], rgb[1], rgb[2], xy_from_kelvin[0], xy_from_kelvin[1],
+    )
 
-    # Calculate solar midnight (opposite of solar noon)
-    solar_noon = solar_events["noon"]
-    solar_midnight = solar_noon - timedelta(hours=12) if solar_noon.hour >= 12 else solar_noon + timedelta(hours=12)
+    return values
 
-    # Prepare curve parameters (use provided config or defaults)
-    kwargs = {
-        "min_color_temp": min_color_temp,
-        "max_color_temp": max_color_temp,
-        "min_brightness": min_brightness,
-        "max_brightness": max_brightness,
-        "sunrise_time": solar_events["sunrise"],
-        "sunset_time": solar_events["sunset"],
-        "solar_noon": solar_noon,
-        "solar_midnight": solar_midnight,
-    }
-    
-    # Add simplified parameters from config if provided
-    if config:
-        for key in ["mid_bri_up", "steep_bri_up", "mid_cct_up", "steep_cct_up",
-                   "mid_bri_dn", "steep_bri_dn", "mid_cct_dn", "steep_cct_dn",
-                   "mirror_up", "mirror_dn", "gamma_ui"]:
-            if key in config:
-                kwargs[key] = config[key]
 
-    al = AdaptiveLighting(**kwargs)
+def get_adaptive_lighting_batch(
+    times: Sequence[datetime],
+    *,
+    latitude: Optional[float] = None,
+    longitude: Optional[float] = None,
+    timezone: Optional[str] = None,
+    min_color_temp: int = DEFAULT_MIN_COLOR_TEMP,
+    max_color_temp: int = DEFAULT_MAX_COLOR_TEMP,
+    min_brightness: int = DEFAULT_MIN_BRIGHTNESS,
+    max_brightness: int = DEFAULT_MAX_BRIGHTNESS,
+    config: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """Compute adaptive-lighting values for many timestamps in one call.
 
-    sun_pos = al.calculate_sun_position(now, elev)
-    solar_time = al.get_solar_time(now)
-    
-    # Use simplified curve methods
-    cct = al.calculate_color_temperature(now)
-    bri = al.calculate_brightness(now)
-    
-    # Calculate all color representations
-    rgb = al.color_temperature_to_rgb(cct)
-    xy_from_kelvin = al.color_temperature_to_xy(cct)
+    Returns one dict per entry of *times*, matching what
+    :func:`get_adaptive_lighting` returns for that timestamp. Location and
+    solar events are resolved once per calendar day instead of once per
+    sample, and the per-sample INFO logging is skipped.
+    """
+    latitude, longitude, timezone = _auto_location(latitude, longitude, timezone)
+    if latitude is None or longitude is None:
+        raise ValueError("Latitude/longitude not provided and not found in env vars")
 
-    log_msg = f"{now.isoformat()} – elev {elev:.1f}°, solar_time {solar_time:.2f}h"
-    log_msg += f" | lighting: {cct}K/{bri}%"
-    logger.info(log_msg)
-    
-    # Log color information
-    logger.info(f"Color values: {cct}K, RGB({rgb[0]}, {rgb[1]}, {rgb[2]}), XY({xy_from_kelvin[0]:.4f}, {xy_from_kelvin[1]:.4f})")
+    try:
+        tzinfo = ZoneInfo(timezone) if timezone else None
+    except ZoneInfoNotFoundError:
+        logger.warning("Unknown timezone '%s' – falling back to system local", timezone)
+        tzinfo = None
 
-    return {
-        "color_temp": cct,  # Keep for backwards compatibility
-        "kelvin": cct,
-        "brightness": bri,
-        "rgb": rgb,
-        "xy": xy_from_kelvin,  # Use direct kelvin->xy conversion
-        "sun_position": sun_pos,
-        "solar_time": solar_time
-    }
\ No newline at end of file
+    loc = LocationInfo(latitude=latitude, longitude=longitude, timezone=tzinfo or "UTC")
+    observer = loc.observer
+    curves: Dict[Any, AdaptiveLighting] = {}
+    results: List[Dict[str, Any]] = []
+
+    for current_time in times:
+        now = current_time.astimezone(tzinfo) if tzinfo else current_time
+        day = now.date()
+        al = curves.get(day)
+        if al is None:
+            al = curves[day] = _build_adaptive_lighting(
+                observer, now, loc.timezone,
+                min_color_temp, max_color_temp, min_brightness, max_brightness, config,
+            )
+        values, _ = _evaluate_adaptive_lighting(al, observer, now)
+        results.append(values)
+
+    logger.debug("Computed %d adaptive lighting samples over %d day(s)", len(results), len(curves))
+    return results
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""Event loop selection shared by the add-on's entry points."""
+
+import asyncio
+from typing import Any, Coroutine
+
+try:
+    import uvloop
+except ImportError:  # optional speedup; the default asyncio loop is used when unavailable
+    uvloop = None
+
+
+def run_with_best_loop(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run ``coro`` to completion on uvloop when installed, else on asyncio's loop.
+
+    ``uvloop.run`` only exists from uvloop 0.18; older releases (as packaged by
+    some Alpine versions) are installed through their event loop policy instead.
+    """
+    if uvloop is None:
+        return asyncio.run(coro)
+
+    uvloop_run = getattr(uvloop, "run", None)
+    if uvloop_run is not None:
+        return uvloop_run(coro)
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(coro)
@@ -608,11 +608,13 @@ class ZigBeeController(LightController):
             entity_registry = await self.ws_client.send_message_wait_response({"type": "config/entity_registry/list"})
             
             if entity_registry:
+                # Normalize the group name once rather than for every registry entry
+                group_key = group_name.lower().replace("_", "")
                 for entity in entity_registry:
                     entity_id = entity.get("entity_id", "")
                     # ZHA group entities typically have the group name in their entity_id
                     # They're usually like light.glo_living_room or similar
-                    if entity_id.startswith("light.") and group_name.lower().replace("_", "") in entity_id.lower().replace("_", ""):
+                    if entity_id.startswith("light.") and group_key in entity_id.lower().replace("_", ""):
                         # Found the group entity, move it to Glo area
                         logger.info(f"Found group entity {entity_id} for group {group_name}")
                         
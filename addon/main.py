@@ -6,12 +6,22 @@ import json
 import logging
 import os
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Sequence, Union
 
+from zoneinfo import ZoneInfo
+
 import websockets
+from astral import LocationInfo
+from astral.sun import sun
 from websockets.client import WebSocketClientProtocol
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used when unavailable
+    orjson = None
+
+from event_loop import run_with_best_loop
 from ha_blueprint_manager import BlueprintAutomationManager
 
 from primitives import MagicLightPrimitives
@@ -36,10 +46,98 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Event types handle_message acts on; subscribing per type lets Home Assistant
+# drop everything else (automation_triggered, logbook, etc.) server-side.
+SUBSCRIBED_EVENT_TYPES = (
+    "call_service",
+    "state_changed",
+    "device_registry_updated",
+    "area_registry_updated",
+    "entity_registry_updated",
+)
+
+# Entity ids checked on every state update
+LIGHT_PREFIX = "light."
+SUN_ENTITY_ID = "sun.sun"
+
+# Seconds to wait for Home Assistant to answer a request
+RESPONSE_TIMEOUT = 10.0
+
+# Window for coalescing light state_changed events before group mapping runs
+STATE_COALESCE_DELAY = 0.05
+# magiclight.* services handled in _handle_event; all but magiclight_toggle
+# dispatch per area to the MagicLightPrimitives method of the same name.
+MAGICLIGHT_SERVICES = frozenset({
+    "step_up",
+    "step_down",
+    "reset",
+    "dim_up",
+    "dim_down",
+    "magiclight_on",
+    "magiclight_off",
+    "magiclight_toggle",
+})
+
+# Step/dim presses persist offsets at most this often; a held button then
+# writes the state file once per window instead of once per press.
+MAGIC_STATE_SAVE_DELAY = 0.5
+
+# Decoder for incoming frames. orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so callers can catch the stdlib exception either way.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 class HomeAssistantWebSocketClient:
     """WebSocket client for Home Assistant."""
-    
+
+    # Slot-backed storage for the attributes touched on every received event.
+    # "__dict__" stays in the list so tests and the harness can still patch
+    # methods (e.g. call_service) on individual instances.
+    __slots__ = (
+        "host",
+        "port",
+        "access_token",
+        "use_ssl",
+        "websocket",
+        "message_id",
+        "sun_data",
+        "area_to_light_entity",
+        "area_group_map",
+        "group_entity_info",
+        "primitives",
+        "light_controller",
+        "latitude",
+        "longitude",
+        "timezone",
+        "periodic_update_task",
+        "magic_mode_areas",
+        "magic_mode_time_offsets",
+        "magic_mode_brightness_offsets",
+        "cached_states",
+        "last_states_update",
+        "area_parity_cache",
+        "manage_blueprints",
+        "blueprint_manager",
+        "max_dim_steps",
+        "min_brightness",
+        "max_brightness",
+        "color_mode",
+        "config",
+        "curve_params",
+        "_rx",
+        "_pending",
+        "_lower_cache",
+        "_message_handlers",
+        "_group_refresh_pending",
+        "_group_refresh_handle",
+        "_state_save_handle",
+        "_area_parity_signature",
+        "_loop",
+        "_sync_task",
+        "_sync_dirty",
+        "__dict__",
+    )
+
     def __init__(self, host: str, port: int, access_token: str, use_ssl: bool = False):
         """Initialize the client.
         
@@ -71,6 +169,20 @@ class HomeAssistantWebSocketClient:
         self.cached_states = {}  # Cache of entity states
         self.last_states_update = None  # Timestamp of last states update
         self.area_parity_cache = {}  # Cache of area ZHA parity status
+        self._area_parity_signature: Optional[tuple] = None  # Inputs the parity cache was last built from
+        self._lower_cache: Dict[str, str] = {}  # entity_id -> lowercased entity_id
+        self._message_handlers = {  # Top-level message type -> handler
+            "event": self._handle_event,
+            "result": self._handle_result,
+        }
+        self._group_refresh_pending: Dict[str, Dict[str, Any]] = {}  # Light entity -> latest state awaiting group mapping
+        self._group_refresh_handle: Optional[asyncio.TimerHandle] = None  # Scheduled group mapping flush
+        self._state_save_handle: Optional[asyncio.TimerHandle] = None  # Scheduled deferred magic mode save
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # Event loop of the active connection
+        self._sync_task: Optional[asyncio.Task] = None  # Background ZHA group sync, at most one at a time
+        self._sync_dirty = False  # A sync was requested while _sync_task was running
+        self._rx: Optional[asyncio.Queue] = None  # Inbound messages awaiting dispatch (set while listening)
+        self._pending: Dict[int, asyncio.Queue] = {}  # Message id -> frames for send_message_wait_response
 
         # Restore previously persisted magic mode state (if any)
         self._load_magic_mode_state()
@@ -139,7 +251,7 @@ class HomeAssistantWebSocketClient:
         group_type: str,
     ) -> None:
         """Register a grouped light entity for fast lookup by area aliases."""
-        if not entity_id or not entity_id.startswith("light."):
+        if not entity_id or not entity_id.startswith(LIGHT_PREFIX):
             return
 
         # Track metadata about the entity
@@ -193,13 +305,16 @@ class HomeAssistantWebSocketClient:
         attributes: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Update grouped light mappings for ZHA Magic groups and Hue rooms."""
-        if not entity_id or not entity_id.startswith("light."):
+        if not entity_id or not entity_id.startswith(LIGHT_PREFIX):
             return
 
         attributes = attributes or {}
         friendly_name = friendly_name or ""
         friendly_lower = friendly_name.lower()
-        entity_lower = entity_id.lower()
+        # Entity ids never change case, so lower each one only on first sight
+        entity_lower = self._lower_cache.get(entity_id)
+        if entity_lower is None:
+            entity_lower = self._lower_cache[entity_id] = entity_id.lower()
 
         # Detect Hue grouped light entities exposed by the Hue integration
         is_hue_group = False
@@ -241,29 +356,28 @@ class HomeAssistantWebSocketClient:
                 area_id=area_id,
                 group_type="hue_group",
             )
-            logger.debug(f"Registered Hue grouped light '{entity_id}' for area '{area_name or area_id}'")
+            logger.debug("Registered Hue grouped light '%s' for area '%s'", entity_id, area_name or area_id)
             return
 
-        # Detect Magic_ ZHA group entities
-        if "magic_" not in entity_lower and "magic_" not in friendly_lower:
+        # Detect Magic_ ZHA group entities; each find() scans its string once
+        friendly_idx = friendly_lower.find("magic_")
+        entity_idx = entity_lower.find("magic_")
+        if friendly_idx < 0 and entity_idx < 0:
             return
 
         area_name = None
 
         # Try to extract from friendly_name first (preserving case)
-        if "Magic_" in friendly_name:
-            parts = friendly_name.split("Magic_")
-            if len(parts) >= 2:
-                area_name = parts[-1].strip()
-        elif "magic_" in friendly_lower:
-            idx = friendly_lower.index("magic_")
-            area_name = friendly_name[idx + 6:].strip()
+        _, sep, tail = friendly_name.rpartition("Magic_")
+        if sep:
+            area_name = tail.strip()
+        elif friendly_idx >= 0:
+            area_name = friendly_name[friendly_idx + 6:].strip()
 
         # If not found in friendly_name, try entity_id
-        if not area_name and "magic_" in entity_lower:
-            idx = entity_lower.index("magic_")
-            area_name = entity_id[idx + 6:]
-            area_name = area_name.replace("light.", "")
+        if not area_name and entity_idx >= 0:
+            area_name = entity_id[entity_idx + 6:]
+            area_name = area_name.replace(LIGHT_PREFIX, "")
 
         if area_name:
             self._register_area_group_entity(
@@ -272,7 +386,7 @@ class HomeAssistantWebSocketClient:
                 area_id=None,
                 group_type="zha_group",
             )
-            logger.debug(f"Registered Magic ZHA group '{entity_id}' for area '{area_name}'")
+            logger.debug("Registered Magic ZHA group '%s' for area '%s'", entity_id, area_name)
 
     # Backwards compatibility for tests and legacy callers
     def _update_zha_group_mapping(self, entity_id: str, friendly_name: str) -> None:
@@ -373,13 +487,16 @@ class HomeAssistantWebSocketClient:
         
         # Handle target parameter separately from service_data
         final_target = target or {}
-        final_service_data = service_data.copy() if service_data else {}
+        final_service_data = service_data or {}
         
-        # Extract area_id or entity_id from service_data if present (legacy support)
-        if "area_id" in final_service_data:
-            final_target["area_id"] = final_service_data.pop("area_id")
-        if "entity_id" in final_service_data:
-            final_target["entity_id"] = final_service_data.pop("entity_id")
+        # Extract area_id or entity_id from service_data if present (legacy support).
+        # Only this path needs a private copy; callers' dicts are otherwise sent as-is.
+        if "area_id" in final_service_data or "entity_id" in final_service_data:
+            final_service_data = dict(final_service_data)
+            if "area_id" in final_service_data:
+                final_target["area_id"] = final_service_data.pop("area_id")
+            if "entity_id" in final_service_data:
+                final_target["entity_id"] = final_service_data.pop("entity_id")
         
         # Note: ZHA group vs area-based control is now handled in turn_on_lights_adaptive
         # based on whether the area has ZHA parity (all lights are ZHA)
@@ -397,9 +514,9 @@ class HomeAssistantWebSocketClient:
         if final_target:
             service_msg["target"] = final_target
 
-        logger.debug(f"Sending service call: {domain}.{service} (id: {message_id})")
+        logger.debug("Sending service call: %s.%s (id: %s)", domain, service, message_id)
         await self.websocket.send(json.dumps(service_msg))
-        logger.debug(f"Called service: {domain}.{service} (id: {message_id})")
+        logger.debug("Called service: %s.%s (id: %s)", domain, service, message_id)
         
         return message_id
         
@@ -441,14 +558,14 @@ class HomeAssistantWebSocketClient:
         has_parity = self.area_parity_cache.get(area_id, False)
 
         if hue_entity:
-            logger.debug(f"✓ Using Hue grouped light entity '{hue_entity}' for area '{area_id}'")
+            logger.debug("✓ Using Hue grouped light entity '%s' for area '%s'", hue_entity, area_id)
             return "entity_id", hue_entity
 
         if zha_entity:
             if has_parity:
-                logger.debug(f"✓ Using ZHA group entity '{zha_entity}' for area '{area_id}' (all lights are ZHA)")
+                logger.debug("✓ Using ZHA group entity '%s' for area '%s' (all lights are ZHA)", zha_entity, area_id)
                 return "entity_id", zha_entity
-            logger.debug(f"⚠ Area '{area_id}' has non-ZHA lights, using area-based control for full coverage")
+            logger.debug("⚠ Area '%s' has non-ZHA lights, using area-based control for full coverage", area_id)
         
         logger.info(f"Using area-based control for area '{area_id}'")
         return "area_id", area_id
@@ -516,7 +633,7 @@ class HomeAssistantWebSocketClient:
                     self.cached_states[entity_id] = state
                     
                     # Extract sun data while we're here
-                    if entity_id == "sun.sun":
+                    if entity_id == SUN_ENTITY_ID:
                         self.sun_data = state.get("attributes", {})
                         logger.debug(f"Found sun data: elevation={self.sun_data.get('elevation')}")
             
@@ -545,6 +662,23 @@ class HomeAssistantWebSocketClient:
         return message_id
         
         
+    def _apply_location(self, config: Dict[str, Any]) -> None:
+        """Store HA's location and export it for brain.py's env-var defaults."""
+        self.latitude = config.get("latitude")
+        self.longitude = config.get("longitude")
+        self.timezone = config.get("time_zone")
+
+        # One environ update instead of a branch and assignment per variable
+        os.environ.update({
+            name: str(value)
+            for name, value in (
+                ("HASS_LATITUDE", self.latitude),
+                ("HASS_LONGITUDE", self.longitude),
+                ("HASS_TIME_ZONE", self.timezone),
+            )
+            if value
+        })
+
     async def get_config(self) -> bool:
         """Get Home Assistant configuration and wait for response.
         
@@ -556,19 +690,8 @@ class HomeAssistantWebSocketClient:
         
         if result and isinstance(result, dict):
             if "latitude" in result and "longitude" in result:
-                self.latitude = result.get("latitude")
-                self.longitude = result.get("longitude")
-                self.timezone = result.get("time_zone")
+                self._apply_location(result)
                 logger.info(f"✓ Loaded HA location: lat={self.latitude}, lon={self.longitude}, tz={self.timezone}")
-                
-                # Set environment variables for brain.py to use as defaults
-                if self.latitude:
-                    os.environ["HASS_LATITUDE"] = str(self.latitude)
-                if self.longitude:
-                    os.environ["HASS_LONGITUDE"] = str(self.longitude)
-                if self.timezone:
-                    os.environ["HASS_TIME_ZONE"] = self.timezone
-                    
                 return True
             else:
                 logger.warning(f"⚠ Config response missing location data: {result.keys()}")
@@ -655,9 +778,20 @@ class HomeAssistantWebSocketClient:
         else:
             logger.debug("Magic mode state file contained no active areas")
 
+    def schedule_magic_mode_save(self) -> None:
+        """Persist magic mode state shortly, coalescing bursts of offset changes."""
+        if self._state_save_handle is None:
+            loop = self._loop or asyncio.get_running_loop()
+            self._state_save_handle = loop.call_later(MAGIC_STATE_SAVE_DELAY, self.save_magic_mode_state)
+
     def save_magic_mode_state(self) -> None:
         """Persist the current magic mode state to disk."""
 
+        # This write covers any deferred save that is still pending
+        if self._state_save_handle is not None:
+            self._state_save_handle.cancel()
+            self._state_save_handle = None
+
         path = self._get_state_file_path()
 
         state_payload = {
@@ -669,12 +803,48 @@ class HomeAssistantWebSocketClient:
         }
 
         try:
+            # Serialize up front: json.dump() issues one write() per encoder chunk
+            serialized = json.dumps(state_payload, indent=2, sort_keys=True)
             with open(path, "w", encoding="utf-8") as file:
-                json.dump(state_payload, file, indent=2, sort_keys=True)
+                file.write(serialized)
         except Exception as err:  # noqa: B902 - broad to avoid crashing the add-on
             logger.error("Failed to save magic mode state to %s: %s", path, err)
 
     
+    def _get_parity_cache_path(self) -> str:
+        """Return the path used for persisting the area parity cache."""
+        return os.path.join(self._get_data_directory(), "area_parity_cache.json")
+
+    def _load_area_parity_cache(self) -> None:
+        """Seed the area parity cache from the last successful sync, if any."""
+
+        path = self._get_parity_cache_path()
+        if not os.path.exists(path):
+            return
+
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except Exception as err:  # noqa: B902 - broad to avoid crash on malformed file
+            logger.warning("Failed to load area parity cache from %s: %s", path, err)
+            return
+
+        if isinstance(data, dict):
+            restored = {str(area): bool(value) for area, value in data.items()}
+            self.area_parity_cache.update(restored)
+            logger.info("Restored ZHA parity for %d areas from %s", len(restored), path)
+
+    def _save_area_parity_cache(self) -> None:
+        """Persist the area parity cache so the next start can use it immediately."""
+
+        path = self._get_parity_cache_path()
+        try:
+            serialized = json.dumps(self.area_parity_cache, indent=2, sort_keys=True)
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(serialized)
+        except Exception as err:  # noqa: B902 - broad to avoid crashing the add-on
+            logger.error("Failed to save area parity cache to %s: %s", path, err)
+
     def _update_color_mode_from_config(self, merged_config: Dict[str, Any]):
         """Update color mode from configuration if available.
         
@@ -710,17 +880,18 @@ class HomeAssistantWebSocketClient:
         Uses HA's template engine (no manual area registry lookup).
         """
 
-        # Normalize to list[str]
+        # Walk the input lazily so the fast path can return before touching later areas
         if isinstance(area_id_or_list, str):
-            areas: list[str] = [area_id_or_list]
+            areas: Sequence[Any] = (area_id_or_list,)
         else:
-            areas = [a for a in area_id_or_list if isinstance(a, str)]
-
-        if not areas:
-            logger.warning("[template] no area_id provided")
-            return False
+            areas = area_id_or_list
 
+        saw_area = False
         for area_id in areas:
+            if not isinstance(area_id, str):
+                continue
+            saw_area = True
+
             # Fast path: known group entity for this key
             normalized_key = self._normalize_area_key(area_id)
             light_entity_id = None
@@ -730,7 +901,8 @@ class HomeAssistantWebSocketClient:
             if not light_entity_id:
                 light_entity_id = self._get_fallback_group_entity(area_id)
             if light_entity_id:
-                state = self.cached_states.get(light_entity_id, {}).get("state")
+                cached = self.cached_states.get(light_entity_id)
+                state = cached.get("state") if cached else None
                 logger.info(f"[group_fastpath] {light_entity_id=} {area_id=} state={state}")
                 if state in ("on", "off"):
                     if state == "on":
@@ -744,7 +916,7 @@ class HomeAssistantWebSocketClient:
                 f"| selectattr('state', 'eq', 'on') "
                 f"| list | count > 0 }}}}"
             )
-            logger.debug(f"[template] area={area_id} jinja={template}")
+            logger.debug("[template] area=%s jinja=%s", area_id, template)
 
             resp = await self.send_message_wait_response(
                 {
@@ -768,6 +940,9 @@ class HomeAssistantWebSocketClient:
             else:
                 logger.warning(f"[template] failed for area={area_id}: {resp!r} (treating as off)")
 
+        if not saw_area:
+            logger.warning("[template] no area_id provided")
+
         # None of the areas had lights on
         return False
     
@@ -777,11 +952,14 @@ class HomeAssistantWebSocketClient:
         Args:
             area_id: The area ID to enable magic mode for
         """
+        # Re-enabling an already enabled area (e.g. magiclight_on while on) changes nothing
+        changed = area_id not in self.magic_mode_areas
         self.magic_mode_areas.add(area_id)
 
         # Use existing offset if available, otherwise set to 0
         if area_id not in self.magic_mode_time_offsets:
             self.magic_mode_time_offsets[area_id] = 0
+            changed = True
             logger.info(f"Magic mode enabled for area {area_id}, offset set to 0")
         else:
             logger.info(f"Magic mode enabled for area {area_id}, keeping existing offset: {self.magic_mode_time_offsets[area_id]} minutes")
@@ -789,8 +967,10 @@ class HomeAssistantWebSocketClient:
         # Initialize brightness adjustment storage if needed
         if area_id not in self.magic_mode_brightness_offsets:
             self.magic_mode_brightness_offsets[area_id] = 0.0
+            changed = True
 
-        self.save_magic_mode_state()
+        if changed:
+            self.save_magic_mode_state()
     
     async def disable_magic_mode(self, area_id: str):
         """Disable magic mode for an area.
@@ -840,15 +1020,13 @@ class HomeAssistantWebSocketClient:
             apply_time_offset: Whether to apply the magic mode time offset
             
         Returns:
-            Dict containing adaptive lighting values
+            Dict containing adaptive lighting values (a new dict on every call,
+            so callers may modify it)
         """
         # Apply magic mode time offset if applicable
         if apply_time_offset and area_id in self.magic_mode_time_offsets:
             offset_minutes = self.magic_mode_time_offsets[area_id]
             if offset_minutes != 0:
-                from datetime import timedelta
-                from zoneinfo import ZoneInfo
-                
                 # Get current time or use provided time
                 if current_time is None:
                     tzinfo = ZoneInfo(self.timezone) if self.timezone else None
@@ -961,8 +1139,7 @@ class HomeAssistantWebSocketClient:
         # Log the calculation
         logger.info(f"Adaptive lighting for area {area_id}: {lighting_values['kelvin']}K, {lighting_values['brightness']}%")
 
-        lighting_values = dict(lighting_values)
-
+        # get_adaptive_lighting builds a new dict per call, so it is adjusted in place
         if apply_brightness_adjustment:
             brightness_offset = self.magic_mode_brightness_offsets.get(area_id, 0.0)
             if brightness_offset:
@@ -999,7 +1176,7 @@ class HomeAssistantWebSocketClient:
         try:
             # Only update if area is in magic mode
             if area_id not in self.magic_mode_areas:
-                logger.debug(f"Area {area_id} not in magic mode, skipping update")
+                logger.debug("Area %s not in magic mode, skipping update", area_id)
                 return
             
             # Get adaptive lighting values using centralized method
@@ -1023,11 +1200,6 @@ class HomeAssistantWebSocketClient:
         if not (self.latitude and self.longitude and self.timezone):
             return last_check
             
-        from datetime import timedelta
-        from zoneinfo import ZoneInfo
-        from astral import LocationInfo
-        from astral.sun import sun
-        
         # Get current time in the correct timezone
         tzinfo = ZoneInfo(self.timezone)
         now = datetime.now(tzinfo)
@@ -1147,6 +1319,18 @@ class HomeAssistantWebSocketClient:
                 # Get all areas with their light information
                 areas = await zigbee_controller.get_areas()
             
+            # Registry events fire for changes that don't affect parity (renames,
+            # firmware versions, ...); skip the rebuild when the inputs match
+            signature = tuple(
+                (area_id, area_info.get('name', ''),
+                 len(area_info.get('zha_lights', [])), len(area_info.get('non_zha_lights', [])))
+                for area_id, area_info in areas.items()
+            )
+            if signature == self._area_parity_signature:
+                logger.debug("Area parity inputs unchanged; keeping cached parity")
+                return
+            self._area_parity_signature = signature
+
             # Clear and rebuild the cache
             self.area_parity_cache.clear()
             
@@ -1165,17 +1349,51 @@ class HomeAssistantWebSocketClient:
                 self.area_parity_cache[area_id] = has_parity
                 
                 if has_parity:
-                    logger.info(f"Area '{area_info['name']}' has ZHA parity ({len(zha_lights)} ZHA lights)")
+                    logger.debug("Area '%s' has ZHA parity (%d ZHA lights)", area_info['name'], len(zha_lights))
                 elif non_zha_lights:
-                    logger.info(f"Area '{area_info['name']}' lacks ZHA parity ({len(zha_lights)} ZHA, {len(non_zha_lights)} non-ZHA)")
+                    logger.debug(
+                        "Area '%s' lacks ZHA parity (%d ZHA, %d non-ZHA)",
+                        area_info['name'], len(zha_lights), len(non_zha_lights),
+                    )
                     
-            logger.info(f"Refreshed area parity cache for {len(self.area_parity_cache)} areas")
+            self._save_area_parity_cache()
+
+            with_parity = sum(map(bool, self.area_parity_cache.values()))
+            logger.info(
+                f"Refreshed area parity cache for {len(self.area_parity_cache)} areas "
+                f"({with_parity} with ZHA parity)"
+            )
             
         except Exception as e:
             logger.error(f"Failed to refresh area parity cache: {e}")
     
     async def sync_zha_groups(self):
         """Helper method to sync ZHA groups with all areas."""
+        await self.request_zha_sync()
+
+    def request_zha_sync(self) -> asyncio.Task:
+        """Start a background ZHA group sync, or have the running one go again.
+
+        Registry events (including those caused by a sync's own writes) only
+        mark the sync dirty, so the dispatcher never waits on a sync and a
+        burst of events costs at most one extra pass.
+        """
+        if self._sync_task is not None and not self._sync_task.done():
+            self._sync_dirty = True
+            return self._sync_task
+        self._sync_task = asyncio.create_task(self._run_zha_syncs())
+        return self._sync_task
+
+    async def _run_zha_syncs(self):
+        """Sync until no new request arrived during the previous pass."""
+        while True:
+            self._sync_dirty = False
+            await self._sync_zha_groups()
+            if not self._sync_dirty:
+                return
+
+    async def _sync_zha_groups(self):
+        """Sync ZHA groups and refresh the parity cache (run via request_zha_sync)."""
         try:
             logger.info("=" * 60)
             logger.info("Starting ZHA group sync process")
@@ -1202,272 +1420,203 @@ class HomeAssistantWebSocketClient:
     async def handle_message(self, message: Dict[str, Any]):
         """Handle incoming messages."""
         msg_type = message.get("type")
+        handler = self._message_handlers.get(msg_type)
+        if handler is not None:
+            await handler(message)
+        else:
+            logger.debug("Received message type: %s", msg_type)
+
+    async def _handle_event(self, message: Dict[str, Any]) -> None:
+        """Handle an ``event`` message from a subscription."""
+        event = message.get("event", {})
+        event_type = event.get("event_type", "unknown")
+        event_data = event.get("data", {})
+
+        # By far the most frequent event; skip the service/registry chain for it
+        if event_type == "state_changed":
+            self._handle_state_changed(event_data)
+            return
         
-        if msg_type == "event":
-            event = message.get("event", {})
-            event_type = event.get("event_type", "unknown")
-            event_data = event.get("data", {})
-            
-            logger.debug(f"Event received: {event_type}")
-            
-            # Log more details for call_service events
-            if event_type == "call_service":
-                logger.debug(f"Service called: {event_data.get('domain')}.{event_data.get('service')} with data: {event_data.get('service_data')}")
-            
-            # logger.debug(f"Event data: {json.dumps(event_data, indent=2)}")
-            
-            # Handle custom magiclight service calls
-            if event_type == "call_service" and event_data.get("domain") == "magiclight":
-                service = event_data.get("service")
-                service_data = event_data.get("service_data", {})
-                
-                if service == "step_up":
-                    area_id = service_data.get("area_id")
-                    logger.info(f"Received magiclight.step_up service call for area: {area_id}")
-                    
-                    # Handle both single area (string) and multiple areas (list)
-                    if area_id:
-                        area_list = area_id if isinstance(area_id, list) else [area_id]
-                        for area in area_list:
-                            logger.info(f"Processing step_up for area: {area}")
-                            await self.primitives.step_up(area, "service_call")
-                    else:
-                        logger.warning("step_up called without area_id")
-                        
-                elif service == "step_down":
-                    area_id = service_data.get("area_id")
-                    logger.info(f"Received magiclight.step_down service call for area: {area_id}")
-                    
-                    # Handle both single area (string) and multiple areas (list)
-                    if area_id:
-                        area_list = area_id if isinstance(area_id, list) else [area_id]
-                        for area in area_list:
-                            logger.info(f"Processing step_down for area: {area}")
-                            await self.primitives.step_down(area, "service_call")
-                    else:
-                        logger.warning("step_down called without area_id")
-                        
-                elif service == "reset":
-                    area_id = service_data.get("area_id")
-                    logger.info(f"Received magiclight.reset service call for area: {area_id}")
-                    
-                    # Handle both single area (string) and multiple areas (list)
-                    if area_id:
-                        area_list = area_id if isinstance(area_id, list) else [area_id]
-                        for area in area_list:
-                            logger.info(f"Processing reset for area: {area}")
-                            await self.primitives.reset(area, "service_call")
-                    else:
-                        logger.warning("reset called without area_id")
+        logger.debug("Event received: %s", event_type)
+        
+        # logger.debug(f"Event data: {json.dumps(event_data, indent=2)}")
+        
+        # Handle custom magiclight service calls
+        if event_type == "call_service":
+            domain = event_data.get("domain")
+            service = event_data.get("service")
+            raw_service_data = event_data.get("service_data")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Service called: {domain}.{service} with data: {raw_service_data}")
+
+            # Other integrations' service calls are the bulk of this traffic - nothing to do
+            if domain != "magiclight":
+                return
 
-                elif service == "dim_up":
-                    area_id = service_data.get("area_id")
-                    logger.info(f"Received magiclight.dim_up service call for area: {area_id}")
+            service_data = raw_service_data or {}
+            area_id = service_data.get("area_id")
 
-                    if area_id:
-                        area_list = area_id if isinstance(area_id, list) else [area_id]
-                        for area in area_list:
-                            logger.info(f"Processing dim_up for area: {area}")
-                            await self.primitives.dim_up(area, "service_call")
-                    else:
-                        logger.warning("dim_up called without area_id")
+            # One set lookup replaces a chain of per-service comparisons
+            if service not in MAGICLIGHT_SERVICES:
+                return
 
-                elif service == "dim_down":
-                    area_id = service_data.get("area_id")
-                    logger.info(f"Received magiclight.dim_down service call for area: {area_id}")
+            logger.info(f"Received magiclight.{service} service call for area: {area_id}")
+            if not area_id:
+                logger.warning(f"{service} called without area_id")
+                return
 
-                    if area_id:
-                        area_list = area_id if isinstance(area_id, list) else [area_id]
-                        for area in area_list:
-                            logger.info(f"Processing dim_down for area: {area}")
-                            await self.primitives.dim_down(area, "service_call")
-                    else:
-                        logger.warning("dim_down called without area_id")
+            # Handle both single area (string) and multiple areas (list)
+            area_list = area_id if isinstance(area_id, list) else [area_id]
+            if service == "magiclight_toggle":
+                # For toggle, we need to check ALL areas together to make a single decision
+                await self.primitives.magiclight_toggle_multiple(area_list, "service_call")
+                return
 
-                elif service == "magiclight_on":
-                    area_id = service_data.get("area_id")
-                    logger.info(f"Received magiclight.magiclight_on service call for area: {area_id}")
-                    
-                    # Handle both single area (string) and multiple areas (list)
-                    if area_id:
-                        area_list = area_id if isinstance(area_id, list) else [area_id]
-                        for area in area_list:
-                            logger.info(f"Processing magiclight_on for area: {area}")
-                            await self.primitives.magiclight_on(area, "service_call")
-                    else:
-                        logger.warning("magiclight_on called without area_id")
-                        
-                elif service == "magiclight_off":
-                    area_id = service_data.get("area_id")
-                    logger.info(f"Received magiclight.magiclight_off service call for area: {area_id}")
-                    
-                    # Handle both single area (string) and multiple areas (list)
-                    if area_id:
-                        area_list = area_id if isinstance(area_id, list) else [area_id]
-                        for area in area_list:
-                            logger.info(f"Processing magiclight_off for area: {area}")
-                            await self.primitives.magiclight_off(area, "service_call")
-                    else:
-                        logger.warning("magiclight_off called without area_id")
-                        
-                elif service == "magiclight_toggle":
-                    area_id = service_data.get("area_id")
-                    logger.info(f"Received magiclight.magiclight_toggle service call for area: {area_id}")
-                    
-                    # Handle both single area (string) and multiple areas (list)
-                    if area_id:
-                        area_list = area_id if isinstance(area_id, list) else [area_id]
-                        # For toggle, we need to check ALL areas together to make a single decision
-                        await self.primitives.magiclight_toggle_multiple(area_list, "service_call")
-                    else:
-                        logger.warning("magiclight_toggle called without area_id")
-            
-            
-            # Handle device registry updates (when devices are added/removed/modified)
-            elif event_type == "device_registry_updated":
-                action = event_data.get("action")
-                device_id = event_data.get("device_id")
+            # Service names match the primitive method names
+            handler = getattr(self.primitives, service)
+            for area in area_list:
+                logger.info(f"Processing {service} for area: {area}")
+                await handler(area, "service_call")
+        
+        
+        # Handle device registry updates (when devices are added/removed/modified)
+        elif event_type == "device_registry_updated":
+            action = event_data.get("action")
+            device_id = event_data.get("device_id")
 
-                logger.info(f"Device registry updated: action={action}, device_id={device_id}")
+            logger.info(f"Device registry updated: action={action}, device_id={device_id}")
 
-                # Trigger resync if a device was added, removed, or updated
-                if action in ["create", "update", "remove"]:
-                    await self.sync_zha_groups()  # This includes parity cache refresh
+            # Trigger resync if a device was added, removed, or updated
+            if action in ["create", "update", "remove"]:
+                self.request_zha_sync()  # This includes parity cache refresh
+        
+        # Handle area registry updates (when areas are added/removed/modified)
+        elif event_type == "area_registry_updated":
+            action = event_data.get("action")
+            area_id = event_data.get("area_id")
             
-            # Handle area registry updates (when areas are added/removed/modified)
-            elif event_type == "area_registry_updated":
-                action = event_data.get("action")
-                area_id = event_data.get("area_id")
-                
-                logger.info(f"Area registry updated: action={action}, area_id={area_id}")
-                
-                # Always resync on area changes
-                await self.sync_zha_groups()  # This includes parity cache refresh
+            logger.info(f"Area registry updated: action={action}, area_id={area_id}")
             
-            # Handle entity registry updates (when entities change areas)
-            elif event_type == "entity_registry_updated":
-                action = event_data.get("action")
-                entity_id = event_data.get("entity_id")
-                changes = event_data.get("changes", {})
-                
-                # Check if area_id changed
-                if "area_id" in changes:
-                    old_area = changes["area_id"].get("old_value")
-                    new_area = changes["area_id"].get("new_value")
-                    logger.info(f"Entity {entity_id} moved from area {old_area} to {new_area}")
-                    await self.sync_zha_groups()  # This includes parity cache refresh
+            # Always resync on area changes
+            self.request_zha_sync()  # This includes parity cache refresh
+        
+        # Handle entity registry updates (when entities change areas)
+        elif event_type == "entity_registry_updated":
+            action = event_data.get("action")
+            entity_id = event_data.get("entity_id")
+            changes = event_data.get("changes", {})
             
-            # Handle state changes
-            elif event_type == "state_changed":
-                entity_id = event_data.get("entity_id")
-                new_state = event_data.get("new_state", {})
-                old_state = event_data.get("old_state", {})
-                
-                # Update cached state
-                if entity_id and isinstance(new_state, dict):
-                    self.cached_states[entity_id] = new_state
+            # Check if area_id changed
+            if "area_id" in changes:
+                old_area = changes["area_id"].get("old_value")
+                new_area = changes["area_id"].get("new_value")
+                logger.info(f"Entity {entity_id} moved from area {old_area} to {new_area}")
+                self.request_zha_sync()  # This includes parity cache refresh
+
+    def _handle_state_changed(self, event_data: Dict[str, Any]) -> None:
+        """Update cached state (and sun data) from a ``state_changed`` event."""
+        entity_id = event_data.get("entity_id")
+        new_state = event_data.get("new_state", {})
+        
+        # Update cached state
+        if entity_id and isinstance(new_state, dict):
+            self.cached_states[entity_id] = new_state
+            
+            # Group detection is coalesced: bursts of updates for the same light
+            # are mapped once, with the latest state, when the window closes
+            if entity_id.startswith(LIGHT_PREFIX):
+                self._group_refresh_pending[entity_id] = new_state
+                self._schedule_group_refresh()
+
+            # Update sun data if it's the sun entity
+            elif entity_id == SUN_ENTITY_ID:
+                self.sun_data = new_state.get("attributes", {})
+                logger.info(f"Updated sun data: elevation={self.sun_data.get('elevation')}")
+
+    def _schedule_group_refresh(self) -> None:
+        """Arm the group mapping flush unless one is already pending."""
+        if self._group_refresh_handle is None:
+            loop = self._loop or asyncio.get_running_loop()
+            self._group_refresh_handle = loop.call_later(STATE_COALESCE_DELAY, self._flush_group_refresh)
+
+    def _flush_group_refresh(self) -> None:
+        """Update group mappings for every light that changed in the last window."""
+        self._group_refresh_handle = None
+        pending, self._group_refresh_pending = self._group_refresh_pending, {}
+        for entity_id, state in pending.items():
+            attributes = state.get("attributes", {})
+            friendly_name = attributes.get("friendly_name", "")
+            self._update_area_group_mapping(entity_id, friendly_name, attributes)
+
+    async def _handle_result(self, message: Dict[str, Any]) -> None:
+        """Handle a ``result`` message (states, config, command acks)."""
+        success = message.get("success", False)
+        msg_id = message.get("id")
+        result = message.get("result")
+        
+        # Handle states result
+        # One type check per shape; an empty list/dict is falsy so needs no len()
+        if isinstance(result, list) and result:
+            first_item = result[0]
+            # Check if this is states data
+            if isinstance(first_item, dict) and "entity_id" in first_item:
+                # This is states data - update our cache
+                self.cached_states.clear()
+                for state in result:
+                    entity_id = state.get("entity_id", "")
+                    self.cached_states[entity_id] = state
                     
-                    # Check if this is a ZHA group light entity TODO: THIS IS VERY EXHAUSTIVE
-                    if entity_id.startswith("light."):
-                        attributes = new_state.get("attributes", {})
+                    attributes = state.get("attributes", {})
+                    
+                    # Store initial sun data
+                    if entity_id == SUN_ENTITY_ID:
+                        self.sun_data = attributes
+                        logger.info(f"Initial sun data: elevation={self.sun_data.get('elevation')}")
+                    
+                    # Detect ZHA group light entities (Magic_AREA pattern)
+                    if entity_id.startswith(LIGHT_PREFIX):
+                        # Check both entity_id and friendly_name for Magic_ pattern
                         friendly_name = attributes.get("friendly_name", "")
+                        
+                        # Debug log all light entities
+                        logger.debug("Light entity: %s, friendly_name: %s", entity_id, friendly_name)
+                        
+                        # Use the centralized method to update ZHA group mapping
                         self._update_area_group_mapping(entity_id, friendly_name, attributes)
                 
-                # Update sun data if it's the sun entity
-                if entity_id == "sun.sun" and isinstance(new_state, dict):
-                    self.sun_data = new_state.get("attributes", {})
-                    logger.info(f"Updated sun data: elevation={self.sun_data.get('elevation')}")
-                
+                self.last_states_update = (self._loop or asyncio.get_running_loop()).time()
+                logger.info(f"Cached {len(self.cached_states)} entity states")
                 
-                #if isinstance(new_state, dict):
-                #    logger.info(f"State changed: {entity_id} -> {new_state.get('state')}")
-                #else:
-                #    logger.info(f"State changed: {entity_id} -> {new_state}")
+                # Full light dump is opt-in: it is a second pass over every state on each reconnect
+                if logger.isEnabledFor(logging.DEBUG) and os.getenv("MAGICLIGHT_DUMP_ENTITIES"):
+                    all_lights = (
+                        f"  - {entity_id}: {state.get('attributes', {}).get('friendly_name', '')}"
+                        for entity_id, state in self.cached_states.items()
+                        if entity_id.startswith(LIGHT_PREFIX)
+                    )
+                    logger.debug("=== All Light Entities Found ===\n" + "\n".join(all_lights))
                 
-        elif msg_type == "result":
-            success = message.get("success", False)
-            msg_id = message.get("id")
-            result = message.get("result")
-            
-            # Handle states result
-            if result and isinstance(result, list) and len(result) > 0:
-                first_item = result[0]
-                # Check if this is states data
-                if isinstance(first_item, dict) and "entity_id" in first_item:
-                    # This is states data - update our cache
-                    self.cached_states.clear()
-                    for state in result:
-                        entity_id = state.get("entity_id", "")
-                        self.cached_states[entity_id] = state
-                        
-                        attributes = state.get("attributes", {})
-                        
-                        # Store initial sun data
-                        if entity_id == "sun.sun":
-                            self.sun_data = attributes
-                            logger.info(f"Initial sun data: elevation={self.sun_data.get('elevation')}")
-                        
-                        # Detect ZHA group light entities (Magic_AREA pattern)
-                        if entity_id.startswith("light."):
-                            # Check both entity_id and friendly_name for Magic_ pattern
-                            friendly_name = attributes.get("friendly_name", "")
-                            
-                            # Debug log all light entities
-                            logger.debug(f"Light entity: {entity_id}, friendly_name: {friendly_name}")
-                            
-                            # Use the centralized method to update ZHA group mapping
-                            self._update_area_group_mapping(entity_id, friendly_name, attributes)
-                    
-                    self.last_states_update = asyncio.get_event_loop().time()
-                    logger.info(f"Cached {len(self.cached_states)} entity states")
-                    
-                    # Log ALL light entities for debugging
-                    all_lights = []
-                    for entity_id, state in self.cached_states.items():
-                        if entity_id.startswith("light."):
-                            friendly_name = state.get("attributes", {}).get("friendly_name", "")
-                            all_lights.append((entity_id, friendly_name))
-                    
-                    if all_lights:
-                        logger.info("=== All Light Entities Found ===")
-                        for entity_id, name in all_lights:
-                            logger.info(f"  - {entity_id}: {name}")
-                        logger.info("="*40)
-                    
-                    # Log discovered grouped light entities
-                    if self.group_entity_info:
-                        logger.info("=== Discovered Grouped Light Entities ===")
-                        for entity_id, info in self.group_entity_info.items():
-                            group_type = info.get("type", "unknown")
-                            area_label = info.get("area") or info.get("area_id") or info.get("area_name") or "unknown"
-                            logger.info(f"  - {entity_id} [{group_type}] -> Area: '{area_label}'")
-                        logger.info(f"Total: {len(self.group_entity_info)} grouped entities mapped to areas")
-                        logger.info("=" * 50)
-                    else:
-                        logger.warning("No grouped light entities discovered (Magic_ ZHA or Hue rooms)")
-            
-            # Handle config result
-            elif result and isinstance(result, dict):
-                # Check if this is config data
-                if "latitude" in result and "longitude" in result:
-                    self.latitude = result.get("latitude")
-                    self.longitude = result.get("longitude")
-                    self.timezone = result.get("time_zone")
-                    logger.info(f"Home Assistant location: lat={self.latitude}, lon={self.longitude}, tz={self.timezone}")
-                    
-                    # Set environment variables for brain.py to use as defaults
-                    if self.latitude:
-                        os.environ["HASS_LATITUDE"] = str(self.latitude)
-                    if self.longitude:
-                        os.environ["HASS_LONGITUDE"] = str(self.longitude)
-                    if self.timezone:
-                        os.environ["HASS_TIME_ZONE"] = self.timezone
-            
-            logger.debug(f"Result for message {msg_id}: {'success' if success else 'failed'}")
-            
-        else:
-            logger.debug(f"Received message type: {msg_type}")
-            
+                # Log discovered grouped light entities
+                if self.group_entity_info:
+                    logger.info("=== Discovered Grouped Light Entities ===")
+                    for entity_id, info in self.group_entity_info.items():
+                        group_type = info.get("type", "unknown")
+                        area_label = info.get("area") or info.get("area_id") or info.get("area_name") or "unknown"
+                        logger.info(f"  - {entity_id} [{group_type}] -> Area: '{area_label}'")
+                    logger.info(f"Total: {len(self.group_entity_info)} grouped entities mapped to areas")
+                    logger.info("=" * 50)
+                else:
+                    logger.warning("No grouped light entities discovered (Magic_ ZHA or Hue rooms)")
+        
+        # Handle config result
+        elif isinstance(result, dict) and result:
+            # Check if this is config data
+            if "latitude" in result and "longitude" in result:
+                self._apply_location(result)
+                logger.info(f"Home Assistant location: lat={self.latitude}, lon={self.longitude}, tz={self.timezone}")
+        
+        logger.debug("Result for message %s: %s", msg_id, "success" if success else "failed")
+
     async def send_message_wait_response(
     self,
     message: Dict[str, Any],
@@ -1481,41 +1630,80 @@ class HomeAssistantWebSocketClient:
         message["id"] = self._get_next_message_id()
         msg_id = message["id"]
 
+        # While the reader task owns the socket, responses are routed to us by id
+        waiter: Optional[asyncio.Queue] = None
+        if self._rx is not None:
+            waiter = asyncio.Queue()
+            self._pending[msg_id] = waiter
+
+        try:
+            return await self._wait_for_response(message, msg_id, waiter, full_envelope)
+        finally:
+            self._pending.pop(msg_id, None)
+
+    async def _wait_for_response(
+        self,
+        message: Dict[str, Any],
+        msg_id: int,
+        waiter: Optional[asyncio.Queue],
+        full_envelope: bool,
+    ) -> Optional[Dict[str, Any]]:
+        """Send a message and collect the frames answering it."""
         try:
             await self.websocket.send(json.dumps(message))
         except Exception as e:
             logger.error(f"WebSocket send failed for id={msg_id}: {e}")
             return None
 
-        overall_timeout = 10.0
-        deadline = asyncio.get_event_loop().time() + overall_timeout
+        # One timer for the whole exchange instead of re-arming a deadline per frame
+        try:
+            return await asyncio.wait_for(
+                self._collect_response(
+                    msg_id,
+                    waiter,
+                    full_envelope,
+                    is_render_template=(message.get("type") == "render_template"),
+                ),
+                timeout=RESPONSE_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"Timeout waiting for response to message id={msg_id}")
+            return None
+
+    async def _collect_response(
+        self,
+        msg_id: int,
+        waiter: Optional[asyncio.Queue],
+        full_envelope: bool,
+        *,
+        is_render_template: bool,
+    ) -> Optional[Dict[str, Any]]:
+        """Consume frames for msg_id until one answers the request."""
         need_event_followup = False
-        is_render_template = (message.get("type") == "render_template")
 
         while True:
-            remaining = deadline - asyncio.get_event_loop().time()
-            if remaining <= 0:
-                logger.error(f"Timeout waiting for response to message id={msg_id}")
-                return None
-
-            try:
-                frame = await asyncio.wait_for(self.websocket.recv(), timeout=remaining)
-            except asyncio.TimeoutError:
-                logger.error(f"Timeout waiting for response to message id={msg_id}")
-                return None
-            except Exception as e:
-                logger.error(f"Error waiting for response to id={msg_id}: {e}")
-                return None
+            if waiter is not None:
+                # Frames arrive already decoded and matched to our id
+                data = await waiter.get()
+                if data is None:
+                    logger.error(f"Connection closed while waiting for response to id={msg_id}")
+                    return None
+            else:
+                try:
+                    frame = await self.websocket.recv()
+                except Exception as e:
+                    logger.error(f"Error waiting for response to id={msg_id}: {e}")
+                    return None
 
-            try:
-                data = json.loads(frame)
-            except Exception:
-                logger.debug(f"Ignoring non-JSON frame while waiting for id={msg_id}: {frame!r}")
-                continue
+                try:
+                    data = _json_loads(frame)
+                except Exception:
+                    logger.debug("Ignoring non-JSON frame while waiting for id=%s: %r", msg_id, frame)
+                    continue
 
-            # Ignore unrelated frames (e.g., other subscriptions)
-            if data.get("id") != msg_id:
-                continue
+                # Ignore unrelated frames (e.g., other subscriptions)
+                if data.get("id") != msg_id:
+                    continue
 
             # Case A: render_template sends a 'result' (often null) then an 'event' with the real value
             if is_render_template:
@@ -1553,18 +1741,71 @@ class HomeAssistantWebSocketClient:
                 logger.error(f"Error response to id={msg_id}: {err}")
                 return None
     
+    async def _reader(self) -> None:
+        """Receive frames and route them to response waiters or the dispatch queue.
+
+        Only decoding and routing happen here so the socket keeps being drained
+        while the dispatcher is busy running primitives for an earlier event.
+        """
+        try:
+            async for frame in self.websocket:
+                try:
+                    msg = _json_loads(frame)
+                except json.JSONDecodeError:
+                    logger.error(f"Failed to decode message: {frame}")
+                    continue
+
+                waiter = self._pending.get(msg.get("id"))
+                if waiter is not None:
+                    waiter.put_nowait(msg)
+                    continue
+
+                try:
+                    self._rx.put_nowait(msg)
+                except asyncio.QueueFull:
+                    logger.warning(f"Dispatch queue full, dropping {msg.get('type')} message")
+        finally:
+            # Wake anyone still waiting so they fail fast instead of timing out
+            for waiter in self._pending.values():
+                waiter.put_nowait(None)
+            if self._rx.full():
+                self._rx.get_nowait()  # make room for the shutdown sentinel
+            self._rx.put_nowait(None)
+
+    async def _dispatcher(self) -> None:
+        """Handle queued messages in arrival order until the reader shuts down."""
+        while True:
+            msg = await self._rx.get()
+            if msg is None:
+                return
+            try:
+                await self.handle_message(msg)
+            except Exception as e:
+                logger.error(f"Error handling message: {e}")
+
     async def listen(self):
         """Main listener loop."""
+        reader_task = None
+        dispatcher_task = None
+        sync_task = None
+        if not self.area_parity_cache:
+            self._load_area_parity_cache()
         try:
             logger.info(f"Connecting to {self.websocket_url}")
             
             async with websockets.connect(self.websocket_url) as websocket:
                 self.websocket = websocket
+                self._loop = asyncio.get_running_loop()
                 
                 # Authenticate
                 if not await self.authenticate():
                     logger.error("Failed to authenticate")
                     return
+
+                # From here on the reader task owns websocket.recv()
+                self._rx = asyncio.Queue(maxsize=1024)
+                reader_task = asyncio.create_task(self._reader())
+                dispatcher_task = asyncio.create_task(self._dispatcher())
                     
                 # Initialize light controller with websocket client
                 self.light_controller = MultiProtocolController(self)
@@ -1581,17 +1822,16 @@ class HomeAssistantWebSocketClient:
                 else:
                     logger.info(f"Successfully loaded {len(states)} entity states")
                     
-                    # Count light entities
-                    light_count = sum(1 for s in states if s.get("entity_id", "").startswith("light."))
-                    logger.info(f"Found {light_count} light entities")
-                    
-                    # Process states to extract grouped light mappings
+                    # Process states to extract grouped light mappings, counting lights in the same pass
+                    light_count = 0
                     for state in states:
                         entity_id = state.get("entity_id", "")
-                        if entity_id.startswith("light."):
+                        if entity_id.startswith(LIGHT_PREFIX):
+                            light_count += 1
                             attributes = state.get("attributes", {})
                             friendly_name = attributes.get("friendly_name", "")
                             self._update_area_group_mapping(entity_id, friendly_name, attributes)
+                    logger.info(f"Found {light_count} light entities")
                     
                     grouped_count = len(self.group_entity_info)
                     if grouped_count > 0:
@@ -1605,9 +1845,6 @@ class HomeAssistantWebSocketClient:
                 if not config_loaded:
                     logger.warning("⚠ Failed to load Home Assistant configuration - adaptive lighting may not work correctly")
                 
-                # Sync ZHA groups with all areas (includes parity cache refresh)
-                await self.sync_zha_groups()
-
                 # Ensure managed blueprint automations are in place before event processing
                 if self.manage_blueprints:
                     await self.blueprint_manager.reconcile_now("startup")
@@ -1615,29 +1852,40 @@ class HomeAssistantWebSocketClient:
                     await self.blueprint_manager.remove_blueprint_files("startup-disabled")
                     await self.blueprint_manager.purge_managed_automations("startup-disabled")
 
-                # Subscribe to all events
-                await self.subscribe_events()
+                # Subscribe only to the events we handle
+                for event_type in SUBSCRIBED_EVENT_TYPES:
+                    await self.subscribe_events(event_type)
                 
+                # Sync ZHA groups with all areas (includes parity cache refresh) in the
+                # background; until it finishes, control uses the restored parity cache
+                sync_task = self.request_zha_sync()
+
                 # Start periodic light updater
                 self.periodic_update_task = asyncio.create_task(self.periodic_light_updater())
                 logger.info("Started periodic light updater (runs every 60 seconds)")
                 
                 # Listen for messages
                 logger.info("Listening for events...")
-                async for message in websocket:
-                    try:
-                        msg = json.loads(message)
-                        await self.handle_message(msg)
-                    except json.JSONDecodeError:
-                        logger.error(f"Failed to decode message: {message}")
-                    except Exception as e:
-                        logger.error(f"Error handling message: {e}")
+                await asyncio.gather(reader_task, dispatcher_task)
                         
         except websockets.exceptions.ConnectionClosed:
             logger.warning("WebSocket connection closed")
         except Exception as e:
             logger.error(f"Connection error: {e}")
         finally:
+            for task in (sync_task, reader_task, dispatcher_task):
+                if task and not task.done():
+                    task.cancel()
+                    try:
+                        await task
+                    except (asyncio.CancelledError, Exception):
+                        pass
+            self._rx = None
+            if self._group_refresh_handle is not None:
+                self._group_refresh_handle.cancel()
+                self._flush_group_refresh()
+            if self._state_save_handle is not None:
+                self.save_magic_mode_state()
             # Cancel periodic updater if running
             if self.periodic_update_task and not self.periodic_update_task.done():
                 self.periodic_update_task.cancel()
@@ -1682,8 +1930,9 @@ def main():
     # Create and run client
     client = HomeAssistantWebSocketClient(host, port, token, use_ssl)
     
+    # uvloop's libuv-based loop cuts per-frame overhead on the WebSocket read path
     try:
-        asyncio.run(client.run())
+        run_with_best_loop(client.run())
     except KeyboardInterrupt:
         logger.info("Shutting down...")
 
@@ -1,14 +1,31 @@
 #!/usr/bin/env python3
 """MagicLight Primitives - Core actions that can be triggered via service calls or other means."""
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
 from brain import calculate_dimming_step, DEFAULT_MAX_DIM_STEPS
 
 logger = logging.getLogger(__name__)
 
+# TimeLocation offset bounds in minutes (-6 hours to +18 hours from solar noon)
+MIN_TIME_OFFSET = -360
+MAX_TIME_OFFSET = 1080
+
+# Fixed step and bound used when the dimming calculation fails
+FALLBACK_STEP_MINUTES = 30
+FALLBACK_OFFSET_LIMIT = 720
+
+# Transition (seconds) for step up/down light updates
+STEP_TRANSITION = 0.2
+
+
+def _clamp(value, low, high):
+    """Clamp value to [low, high] without the call overhead of max(min(...))."""
+    return low if value < low else high if value > high else value
+
 
 class MagicLightPrimitives:
     """Handles all MagicLight primitive actions/service calls."""
@@ -29,6 +46,16 @@ class MagicLightPrimitives:
         if not hasattr(self.client, 'get_brightness_bounds'):
             self.client.get_brightness_bounds = lambda: (1, 100)
         
+    def _dimming_settings(self) -> Tuple[int, Dict[str, Any]]:
+        """Return (max_dim_steps, curve_params) from the client's current config.
+
+        Read on each press since the client replaces both whenever it reloads
+        config; a single getattr per value avoids hasattr's double lookup.
+        """
+        config = getattr(self.client, 'config', None)
+        max_steps = config.get('max_dim_steps', DEFAULT_MAX_DIM_STEPS) if config else DEFAULT_MAX_DIM_STEPS
+        return max_steps, getattr(self.client, 'curve_params', None) or {}
+
     async def step_up(self, area_id: str, source: str = "service_call"):
         """Step up - Adjust TimeLocation to brighten and cool lights one step up the MagicLight curve.
         
@@ -36,106 +63,7 @@ class MagicLightPrimitives:
             area_id: The area ID to control
             source: Source of the action (e.g., "service_call", "switch", etc.)
         """
-        # Check if area is in magic mode (HomeGlo enabled)
-        if area_id in self.client.magic_mode_areas:
-            logger.info(f"[{source}] Stepping up along MagicLight curve for area {area_id}")
-            
-            # Get current time with offset (TimeLocation)
-            current_offset = self.client.magic_mode_time_offsets.get(area_id, 0)
-            current_time = datetime.now() + timedelta(minutes=current_offset)
-            
-            try:
-                # Get max_dim_steps from config if available
-                max_steps = DEFAULT_MAX_DIM_STEPS
-                if hasattr(self.client, 'config') and self.client.config:
-                    max_steps = self.client.config.get('max_dim_steps', DEFAULT_MAX_DIM_STEPS)
-                
-                # Get curve parameters from client if available
-                curve_params = {}
-                if hasattr(self.client, 'curve_params'):
-                    curve_params = self.client.curve_params
-                
-                dimming_result = calculate_dimming_step(
-                    current_time=current_time,
-                    action='brighten',
-                    max_steps=max_steps,
-                    **curve_params
-                )
-
-                # Get dynamic min/max values from curve_params
-                max_brightness = curve_params.get('max_brightness', 100)
-                max_kelvin = curve_params.get('max_color_temp', 6500)
-
-                # Check if this would put us at maximum values (stuck on plateau)
-                # If brightening result is already at maximum, don't apply the offset change
-                if dimming_result['brightness'] >= max_brightness and dimming_result['kelvin'] >= max_kelvin:
-                    logger.info(f"Step up would reach maximum plateau ({max_brightness}%, {max_kelvin}K) - stopping at current offset {current_offset:.1f} minutes")
-                    # Don't change the offset, just return current state
-                    lighting_values = await self.client.get_adaptive_lighting_for_area(area_id)
-                    await self.client.turn_on_lights_adaptive(area_id, lighting_values, transition=0.2)
-                    return
-
-                # Update the TimeLocation (stored offset)
-                new_offset = current_offset + dimming_result['time_offset_minutes']
-                # Limit offset to reasonable bounds (-6 hours to +18 hours from solar noon)
-                # This keeps us within meaningful parts of the solar day curve
-                new_offset = max(-360, min(1080, new_offset))
-                self.client.magic_mode_time_offsets[area_id] = new_offset
-                self.client.save_magic_mode_state()
-                logger.info(f"TimeLocation for area {area_id}: {current_offset:.1f} -> {new_offset:.1f} minutes")
-
-                # Recalculate adaptive lighting so brightness offsets are respected
-                lighting_values = await self.client.get_adaptive_lighting_for_area(area_id)
-
-                if 'brightness' in lighting_values:
-                    min_bri, max_bri = self.client.get_brightness_bounds()
-                    lighting_values['brightness'] = int(
-                        max(min_bri, min(max_bri, lighting_values['brightness']))
-                    )
-
-                await self.client.turn_on_lights_adaptive(area_id, lighting_values, transition=0.2)
-                logger.info(
-                    f"Applied MagicLight step up: {lighting_values.get('kelvin')}K, "
-                    f"{lighting_values.get('brightness')}%"
-                )
-                
-            except Exception as e:
-                logger.error(f"Error calculating step up: {e}")
-                # Fall back to simple time offset adjustment
-                new_offset = current_offset + 30
-                new_offset = max(-720, min(720, new_offset))
-                self.client.magic_mode_time_offsets[area_id] = new_offset
-                self.client.save_magic_mode_state()
-                
-                lighting_values = await self.client.get_adaptive_lighting_for_area(area_id)
-                await self.client.turn_on_lights_adaptive(area_id, lighting_values, transition=0.2)
-            
-        else:
-            # Not in MagicLight mode - use standard brightness increase
-            logger.info(f"[{source}] Area {area_id} not in MagicLight mode, using standard brightness increase")
-            
-            # Check if any lights are on
-            any_light_on = await self.client.any_lights_on_in_area(area_id)
-            
-            if not any_light_on:
-                logger.info(f"No lights are on in area {area_id}, nothing to brighten")
-                return
-            
-            step_pct = self.client.get_brightness_step_pct()
-            ha_step_pct = int(round(step_pct)) or (1 if step_pct > 0 else 0)
-            if ha_step_pct == 0:
-                logger.info(f"Calculated brightness_step_pct is 0 for area {area_id}, skipping")
-                return
-
-            # Increase brightness
-            target_type, target_value = await self.client.determine_light_target(area_id)
-            service_data = {
-                "brightness_step_pct": ha_step_pct,
-                "transition": 1
-            }
-            target = {target_type: target_value}
-            await self.client.call_service("light", "turn_on", service_data, target)
-            logger.info(f"Brightness increased by {ha_step_pct}% in area {area_id}")
+        await self._step_along_curve(area_id, direction=1, source=source)
         
     async def step_down(self, area_id: str, source: str = "service_call"):
         """Step down - Adjust TimeLocation to dim and warm lights one step down the MagicLight curve.
@@ -144,54 +72,64 @@ class MagicLightPrimitives:
             area_id: The area ID to control
             source: Source of the action (e.g., "service_call", "switch", etc.)
         """
+        await self._step_along_curve(area_id, direction=-1, source=source)
+
+    async def _step_along_curve(self, area_id: str, direction: int, source: str) -> None:
+        """Move an area's TimeLocation one step up (direction=1) or down (direction=-1)."""
+        label = "up" if direction > 0 else "down"
+
         # Check if area is in magic mode (HomeGlo enabled)
         if area_id in self.client.magic_mode_areas:
-            logger.info(f"[{source}] Stepping down along MagicLight curve for area {area_id}")
+            logger.info(f"[{source}] Stepping {label} along MagicLight curve for area {area_id}")
             
             # Get current time with offset (TimeLocation)
             current_offset = self.client.magic_mode_time_offsets.get(area_id, 0)
             current_time = datetime.now() + timedelta(minutes=current_offset)
             
             try:
-                # Get max_dim_steps from config if available
-                max_steps = DEFAULT_MAX_DIM_STEPS
-                if hasattr(self.client, 'config') and self.client.config:
-                    max_steps = self.client.config.get('max_dim_steps', DEFAULT_MAX_DIM_STEPS)
-                
-                
-                # Get curve parameters from client if available
-                curve_params = {}
-                if hasattr(self.client, 'curve_params'):
-                    curve_params = self.client.curve_params
+                max_steps, curve_params = self._dimming_settings()
                 
                 dimming_result = calculate_dimming_step(
                     current_time=current_time,
-                    action='dim',
+                    action='brighten' if direction > 0 else 'dim',
                     max_steps=max_steps,
                     **curve_params
                 )
 
-                # Get dynamic min/max values from curve_params
-                min_brightness = curve_params.get('min_brightness', 1)
-                min_kelvin = curve_params.get('min_color_temp', 500)
+                # Check if this would put us at the curve's extreme values (stuck on plateau)
+                # If the result is already at the limit, don't apply the offset change
+                if direction > 0:
+                    limit_brightness = curve_params.get('max_brightness', 100)
+                    limit_kelvin = curve_params.get('max_color_temp', 6500)
+                    at_plateau = (
+                        dimming_result['brightness'] >= limit_brightness
+                        and dimming_result['kelvin'] >= limit_kelvin
+                    )
+                else:
+                    limit_brightness = curve_params.get('min_brightness', 1)
+                    limit_kelvin = curve_params.get('min_color_temp', 500)
+                    at_plateau = (
+                        dimming_result['brightness'] <= limit_brightness
+                        and dimming_result['kelvin'] <= limit_kelvin
+                    )
 
-                # Check if this would put us at minimum values (stuck on plateau)
-                # If dimming result is already at minimum, don't apply the offset change
-                if dimming_result['brightness'] <= min_brightness and dimming_result['kelvin'] <= min_kelvin:
-                    logger.info(f"Step down would reach minimum plateau ({min_brightness}%, {min_kelvin}K) - stopping at current offset {current_offset:.1f} minutes")
+                if at_plateau:
+                    extreme = "maximum" if direction > 0 else "minimum"
+                    logger.info(f"Step {label} would reach {extreme} plateau ({limit_brightness}%, {limit_kelvin}K) - stopping at current offset {current_offset:.1f} minutes")
                     # Don't change the offset, just return current state
                     lighting_values = await self.client.get_adaptive_lighting_for_area(area_id)
-                    await self.client.turn_on_lights_adaptive(area_id, lighting_values, transition=0.2)
+                    await self.client.turn_on_lights_adaptive(area_id, lighting_values, transition=STEP_TRANSITION)
                     return
 
                 # Update the TimeLocation (stored offset)
                 new_offset = current_offset + dimming_result['time_offset_minutes']
                 # Limit offset to reasonable bounds (-6 hours to +18 hours from solar noon)
                 # This keeps us within meaningful parts of the solar day curve
-                new_offset = max(-360, min(1080, new_offset))
-                self.client.magic_mode_time_offsets[area_id] = new_offset
-                self.client.save_magic_mode_state()
-
+                new_offset = _clamp(new_offset, MIN_TIME_OFFSET, MAX_TIME_OFFSET)
+                # A held button pinned at a bound repeats the same offset; skip the save then
+                if new_offset != current_offset:
+                    self.client.magic_mode_time_offsets[area_id] = new_offset
+                    self.client.schedule_magic_mode_save()
                 logger.info(f"TimeLocation for area {area_id}: {current_offset:.1f} -> {new_offset:.1f} minutes")
 
                 # Recalculate adaptive lighting so brightness offsets are respected
@@ -200,37 +138,40 @@ class MagicLightPrimitives:
                 if 'brightness' in lighting_values:
                     min_bri, max_bri = self.client.get_brightness_bounds()
                     lighting_values['brightness'] = int(
-                        max(min_bri, min(max_bri, lighting_values['brightness']))
+                        _clamp(lighting_values['brightness'], min_bri, max_bri)
                     )
 
-                await self.client.turn_on_lights_adaptive(area_id, lighting_values, transition=0.2)
+                await self.client.turn_on_lights_adaptive(area_id, lighting_values, transition=STEP_TRANSITION)
                 logger.info(
-                    f"Applied MagicLight step down: {lighting_values.get('kelvin')}K, "
+                    f"Applied MagicLight step {label}: {lighting_values.get('kelvin')}K, "
                     f"{lighting_values.get('brightness')}%"
                 )
                 
             except Exception as e:
-                logger.error(f"Error calculating step down: {e}")
+                logger.error(f"Error calculating step {label}: {e}")
                 # Fall back to simple time offset adjustment
-                new_offset = current_offset - 30
-                new_offset = max(-720, min(720, new_offset))
+                new_offset = current_offset + direction * FALLBACK_STEP_MINUTES
+                new_offset = _clamp(new_offset, -FALLBACK_OFFSET_LIMIT, FALLBACK_OFFSET_LIMIT)
                 self.client.magic_mode_time_offsets[area_id] = new_offset
-                self.client.save_magic_mode_state()
+                self.client.schedule_magic_mode_save()
                 
                 lighting_values = await self.client.get_adaptive_lighting_for_area(area_id)
-                lighting_values = lighting_values.copy()
-                lighting_values['brightness'] = max(1, lighting_values['brightness'])
-                await self.client.turn_on_lights_adaptive(area_id, lighting_values, transition=0.2)
+                if direction < 0:
+                    # get_adaptive_lighting_for_area returns a fresh dict, so adjust it in place
+                    lighting_values['brightness'] = max(1, lighting_values['brightness'])
+                await self.client.turn_on_lights_adaptive(area_id, lighting_values, transition=STEP_TRANSITION)
             
         else:
-            # Not in MagicLight mode - use standard brightness decrease
-            logger.info(f"[{source}] Area {area_id} not in MagicLight mode, using standard brightness decrease")
+            # Not in MagicLight mode - use a standard brightness step
+            change = "increase" if direction > 0 else "decrease"
+            logger.info(f"[{source}] Area {area_id} not in MagicLight mode, using standard brightness {change}")
             
             # Check if any lights are on
             any_light_on = await self.client.any_lights_on_in_area(area_id)
             
             if not any_light_on:
-                logger.info(f"No lights are on in area {area_id}, nothing to dim")
+                verb = "brighten" if direction > 0 else "dim"
+                logger.info(f"No lights are on in area {area_id}, nothing to {verb}")
                 return
             
             step_pct = self.client.get_brightness_step_pct()
@@ -239,15 +180,15 @@ class MagicLightPrimitives:
                 logger.info(f"Calculated brightness_step_pct is 0 for area {area_id}, skipping")
                 return
 
-            # Decrease brightness by configured amount - Home Assistant handles minimum brightness
+            # Step brightness by the configured amount - Home Assistant handles the limits
             target_type, target_value = await self.client.determine_light_target(area_id)
             service_data = {
-                "brightness_step_pct": -ha_step_pct,  # Negative value to decrease
-                "transition": 0.5
+                "brightness_step_pct": direction * ha_step_pct,
+                "transition": 1 if direction > 0 else 0.5
             }
             target = {target_type: target_value}
             await self.client.call_service("light", "turn_on", service_data, target)
-            logger.info(f"Brightness decreased by {ha_step_pct}% in area {area_id}")
+            logger.info(f"Brightness {change}d by {ha_step_pct}% in area {area_id}")
 
     async def dim_up(self, area_id: str, source: str = "service_call"):
         """Increase the brightness curve while keeping color in sync."""
@@ -310,10 +251,14 @@ class MagicLightPrimitives:
                     f"{target_brightness}% (offset {new_offset:+.2f}%)"
                 )
 
-            offsets[area_id] = round(new_offset, 4)
-            self.client.save_magic_mode_state()
+            rounded_offset = round(new_offset, 4)
+            if offsets.get(area_id) != rounded_offset:
+                offsets[area_id] = rounded_offset
+                self.client.schedule_magic_mode_save()
 
-            lighting_values = await self.client.get_adaptive_lighting_for_area(area_id)
+            # Reuse the base curve values rather than evaluating the curve a second time
+            lighting_values = dict(base_values)
+            lighting_values['brightness'] = int(round(target_brightness))
             await self.client.turn_on_lights_adaptive(
                 area_id,
                 lighting_values,
@@ -435,32 +380,39 @@ class MagicLightPrimitives:
             # Lights are on somewhere - turn off ALL areas and disable MagicLight
             logger.info(f"Lights are on in at least one area, turning off all areas and disabling MagicLight")
             
-            for area_id in area_ids:
-                # Disable HomeGlo mode first to prevent race conditions
-                if area_id in self.client.magic_mode_areas:
-                    await self.client.disable_magic_mode(area_id)
-                    logger.info(f"HomeGlo disabled for area {area_id}")
-                
-                # Then turn off all lights
-                target_type, target_value = await self.client.determine_light_target(area_id)
-                service_data = {"transition": 1}
-                target = {target_type: target_value}
-                await self.client.call_service("light", "turn_off", service_data, target)
+            # Areas are independent, so their commands are sent concurrently
+            await asyncio.gather(*(self._toggle_area_off(area_id) for area_id in area_ids))
             
         else:
             # All lights are off - turn them all on with MagicLight
             logger.info(f"All lights are off in all areas, enabling MagicLight and turning on")
             
-            for area_id in area_ids:
-                # Enable magic mode (sets MagicLight = true)
-                self.client.enable_magic_mode(area_id)
-                
-                # Get and apply adaptive lighting values
-                lighting_values = await self.client.get_adaptive_lighting_for_area(area_id)
-                await self.client.turn_on_lights_adaptive(area_id, lighting_values, transition=1)
-                
-                offset = self.client.magic_mode_time_offsets.get(area_id, 0)
-                logger.info(f"MagicLight enabled for area {area_id} with TimeLocation offset {offset} minutes")
+            await asyncio.gather(*(self._toggle_area_on(area_id) for area_id in area_ids))
+
+    async def _toggle_area_off(self, area_id: str) -> None:
+        """Disable MagicLight for one area, then turn its lights off."""
+        # Disable HomeGlo mode first to prevent race conditions
+        if area_id in self.client.magic_mode_areas:
+            await self.client.disable_magic_mode(area_id)
+            logger.info(f"HomeGlo disabled for area {area_id}")
+        
+        # Then turn off all lights
+        target_type, target_value = await self.client.determine_light_target(area_id)
+        service_data = {"transition": 1}
+        target = {target_type: target_value}
+        await self.client.call_service("light", "turn_off", service_data, target)
+
+    async def _toggle_area_on(self, area_id: str) -> None:
+        """Enable MagicLight for one area and apply its adaptive lighting."""
+        # Enable magic mode (sets MagicLight = true)
+        self.client.enable_magic_mode(area_id)
+        
+        # Get and apply adaptive lighting values
+        lighting_values = await self.client.get_adaptive_lighting_for_area(area_id)
+        await self.client.turn_on_lights_adaptive(area_id, lighting_values, transition=1)
+        
+        offset = self.client.magic_mode_time_offsets.get(area_id, 0)
+        logger.info(f"MagicLight enabled for area {area_id} with TimeLocation offset {offset} minutes")
     
     async def magiclight_toggle(self, area_id: str, source: str = "service_call"):
         """MagicLight Toggle - Smart toggle based on light state.
@@ -489,12 +441,11 @@ class MagicLightPrimitives:
         self.client.magic_mode_time_offsets[area_id] = 0
 
         # Clear any stored brightness adjustments so curve returns to baseline
-        if hasattr(self.client, 'magic_mode_brightness_offsets'):
-            previous_offset = self.client.magic_mode_brightness_offsets.pop(area_id, None)
-            if previous_offset:
-                logger.info(
-                    f"[{source}] Cleared brightness adjustment of {previous_offset:+.2f}% for area {area_id}"
-                )
+        previous_offset = self.client.magic_mode_brightness_offsets.pop(area_id, None)
+        if previous_offset:
+            logger.info(
+                f"[{source}] Cleared brightness adjustment of {previous_offset:+.2f}% for area {area_id}"
+            )
 
         # Enable magic mode (MagicLight = true)
         # This ensures the area will track time going forward
@@ -1,7 +1,9 @@
 from datetime import datetime
 
+import brain
 from brain import (
     get_adaptive_lighting,
+    get_adaptive_lighting_batch,
     AdaptiveLighting,
     calculate_dimming_step,
 )
@@ -61,3 +63,33 @@ def test_brightness_and_cct_vary_over_day():
     # They should not be identical across halves
     assert bri_m != bri_e or cct_m != cct_e
 
+
+def test_batch_matches_single_calls():
+    times = [datetime(2024, 6, 21, h, 30, 0) for h in (3, 9, 15, 21)]
+    times.append(datetime(2024, 6, 22, 9, 30, 0))  # spans a second day
+    batch = get_adaptive_lighting_batch(times, **SF)
+
+    assert len(batch) == len(times)
+    for when, values in zip(times, batch):
+        assert values == get_adaptive_lighting(current_time=when, **SF)
+
+
+def test_solar_events_cached_per_day():
+    brain._solar_events.cache_clear()
+    get_adaptive_lighting(current_time=datetime(2024, 3, 1, 8, 0, 0), **SF)
+    get_adaptive_lighting(current_time=datetime(2024, 3, 1, 20, 0, 0), **SF)
+    calculate_dimming_step(current_time=datetime(2024, 3, 1, 21, 0, 0), action="dim", **SF)
+
+    info = brain._solar_events.cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+
+
+def test_results_are_fresh_dicts():
+    when = datetime(2024, 3, 1, 8, 0, 0)
+    first = get_adaptive_lighting(current_time=when, **SF)
+    second = get_adaptive_lighting(current_time=when, **SF)
+
+    # Callers adjust results in place, so repeated calls must not share a dict
+    assert first == second
+    assert first is not second
@@ -0,0 +1,41 @@
+import asyncio
+import types
+from unittest.mock import MagicMock, patch
+
+import event_loop
+from event_loop import run_with_best_loop
+
+
+async def _answer():
+    return 42
+
+
+def test_runs_on_asyncio_without_uvloop():
+    with patch.object(event_loop, "uvloop", None), \
+            patch("event_loop.asyncio.set_event_loop_policy") as set_policy:
+        assert run_with_best_loop(_answer()) == 42
+    set_policy.assert_not_called()
+
+
+def test_uses_uvloop_run_when_available():
+    def fake_run(coro):
+        return asyncio.run(coro)
+
+    fake_uvloop = types.SimpleNamespace(run=MagicMock(side_effect=fake_run), EventLoopPolicy=MagicMock())
+    with patch.object(event_loop, "uvloop", fake_uvloop), \
+            patch("event_loop.asyncio.set_event_loop_policy") as set_policy:
+        assert run_with_best_loop(_answer()) == 42
+
+    fake_uvloop.run.assert_called_once()
+    set_policy.assert_not_called()
+
+
+def test_falls_back_to_policy_for_uvloop_without_run():
+    # uvloop < 0.18 has no run(); its loop is installed through the policy instead
+    policy = object()
+    fake_uvloop = types.SimpleNamespace(EventLoopPolicy=MagicMock(return_value=policy))
+    with patch.object(event_loop, "uvloop", fake_uvloop), \
+            patch("event_loop.asyncio.set_event_loop_policy") as set_policy:
+        assert run_with_best_loop(_answer()) == 42
+
+    set_policy.assert_called_once_with(policy)
@@ -297,6 +297,81 @@ class TestMainEventHandling:
         assert "elevation" in self.client.sun_data
         assert self.client.sun_data["elevation"] == 45.0
 
+    @pytest.mark.asyncio
+    async def test_light_state_changes_coalesce_group_mapping(self):
+        """Repeated light updates should be mapped once, using the latest state."""
+        def make_event(brightness):
+            return {
+                "type": "event",
+                "event": {
+                    "event_type": "state_changed",
+                    "data": {
+                        "entity_id": "light.magic_kitchen",
+                        "new_state": {
+                            "state": "on",
+                            "attributes": {"friendly_name": "Magic_Kitchen", "brightness": brightness},
+                        },
+                    },
+                },
+            }
+
+        self.client._update_area_group_mapping = MagicMock()
+        for brightness in (10, 20, 30):
+            await self.client.handle_message(make_event(brightness))
+
+        # Cache is current immediately; mapping waits for the coalescing window
+        assert self.client.cached_states["light.magic_kitchen"]["attributes"]["brightness"] == 30
+        self.client._update_area_group_mapping.assert_not_called()
+        assert self.client._group_refresh_handle is not None
+
+        self.client._group_refresh_handle.cancel()
+        self.client._flush_group_refresh()
+
+        self.client._update_area_group_mapping.assert_called_once_with(
+            "light.magic_kitchen",
+            "Magic_Kitchen",
+            {"friendly_name": "Magic_Kitchen", "brightness": 30},
+        )
+        assert self.client._group_refresh_handle is None
+
+    @pytest.mark.asyncio
+    async def test_registry_events_do_not_wait_for_sync(self):
+        """Registry updates start a background sync instead of blocking dispatch."""
+        release = asyncio.Event()
+        passes = []
+
+        async def slow_sync():
+            passes.append(True)
+            await release.wait()
+
+        self.client._sync_zha_groups = slow_sync
+
+        for event_type, data in (
+            ("area_registry_updated", {"action": "create", "area_id": "magic"}),
+            ("device_registry_updated", {"action": "create", "device_id": "dev"}),
+            ("entity_registry_updated", {"entity_id": "light.g", "changes": {"area_id": {}}}),
+        ):
+            message = {"type": "event", "event": {"event_type": event_type, "data": data}}
+            await asyncio.wait_for(self.client.handle_message(message), timeout=1)
+
+        sync_task = self.client._sync_task
+        assert passes == [True]  # one sync in flight, the other events marked it dirty
+        assert self.client._sync_dirty is True
+
+        release.set()
+        await sync_task
+        assert len(passes) == 2
+
+    def test_enable_magic_mode_skips_save_when_unchanged(self):
+        """Re-enabling an already enabled area should not rewrite saved state."""
+        self.client.save_magic_mode_state = MagicMock()
+
+        self.client.enable_magic_mode("kitchen")
+        self.client.enable_magic_mode("kitchen")
+
+        assert "kitchen" in self.client.magic_mode_areas
+        self.client.save_magic_mode_state.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_handle_message_non_event_type(self):
         """Test handling non-event message types."""
@@ -137,6 +137,15 @@ class TestHomeAssistantWebSocketClient:
         assert client._get_next_message_id() == 2
         assert client.message_id == 3
 
+    def test_init_attributes_use_slots(self):
+        """Test that attributes set during init live in slots, not the instance dict."""
+        client = HomeAssistantWebSocketClient(
+            host="localhost", port=8123, access_token="token"
+        )
+
+        assert "magic_mode_areas" in HomeAssistantWebSocketClient.__slots__
+        assert client.__dict__ == {}
+
     def test_update_zha_group_mapping_magic_prefix(self):
         """Test ZHA group mapping with Magic_ prefix."""
         client = HomeAssistantWebSocketClient(
@@ -272,6 +281,62 @@ class TestHomeAssistantWebSocketClient:
         }
         assert payload["brightness_offsets"] == {"AreaKitchen": 2.5}
 
+    @pytest.mark.asyncio
+    async def test_scheduled_magic_mode_saves_coalesce(self, tmp_path, monkeypatch):
+        """Bursts of scheduled saves should write the latest state once."""
+
+        state_path = tmp_path / "magic_mode_state.json"
+        monkeypatch.setattr(
+            HomeAssistantWebSocketClient,
+            "_get_state_file_path",
+            lambda self: str(state_path),
+        )
+        monkeypatch.setattr("main.MAGIC_STATE_SAVE_DELAY", 0)
+
+        client = HomeAssistantWebSocketClient(
+            host="localhost", port=8123, access_token="token"
+        )
+        client.magic_mode_areas.add("AreaKitchen")
+
+        for offset in (10, 20, 30):
+            client.magic_mode_time_offsets["AreaKitchen"] = offset
+            client.schedule_magic_mode_save()
+        assert not state_path.exists()
+
+        await asyncio.sleep(0.01)
+
+        payload = json.loads(state_path.read_text(encoding="utf-8"))
+        assert payload["time_offsets"] == {"AreaKitchen": 30.0}
+        assert client._state_save_handle is None
+
+    def test_overlapping_sync_requests_coalesce(self):
+        """Requests during a sync queue one more pass instead of running concurrently."""
+        client = HomeAssistantWebSocketClient(
+            host="localhost", port=8123, access_token="token"
+        )
+
+        running = []
+        finished = []
+
+        async def fake_sync():
+            running.append(len(running) - len(finished))
+            if len(running) == 1:
+                # Registry events raised by the sync's own writes
+                for _ in range(3):
+                    client.request_zha_sync()
+            await asyncio.sleep(0)
+            finished.append(True)
+
+        client._sync_zha_groups = fake_sync
+
+        async def overlap():
+            await asyncio.gather(client.sync_zha_groups(), client.sync_zha_groups())
+
+        asyncio.run(overlap())
+        assert running == [0, 0]  # never concurrent
+        assert len(finished) == 2  # one rerun covers every request made meanwhile
+        assert client._sync_dirty is False
+
     def test_components_initialization(self):
         """Test that all required components are initialized."""
         import sys
@@ -372,8 +437,8 @@ class TestHomeAssistantWebSocketClientAsync:
                 return fake_now
 
         monkeypatch.setattr("main.datetime", FixedDateTime)
-        monkeypatch.setattr("astral.LocationInfo", lambda **_: SimpleNamespace(observer=object()))
-        monkeypatch.setattr("astral.sun.sun", lambda observer, date, tzinfo: {"noon": fake_noon})
+        monkeypatch.setattr("main.LocationInfo", lambda **_: SimpleNamespace(observer=object()))
+        monkeypatch.setattr("main.sun", lambda observer, date, tzinfo: {"noon": fake_noon})
 
         save_mock = MagicMock()
         monkeypatch.setattr(self.client, "save_magic_mode_state", save_mock)
@@ -391,6 +456,41 @@ class TestHomeAssistantWebSocketClientAsync:
         save_mock.assert_called_once()
         assert new_last_check == fake_now
 
+    @pytest.mark.asyncio
+    async def test_reader_routes_responses_to_waiters(self):
+        """Test that responses reach their waiter while events go to the dispatcher."""
+        frames = asyncio.Queue()
+
+        class FakeSocket:
+            async def send(self, payload):
+                msg = json.loads(payload)
+                frames.put_nowait(json.dumps({"type": "event", "event": {"event_type": "state_changed", "data": {}}}))
+                frames.put_nowait(json.dumps({"id": msg["id"], "type": "result", "success": True, "result": {"ok": True}}))
+
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                frame = await frames.get()
+                if frame is None:
+                    raise StopAsyncIteration
+                return frame
+
+        handled = []
+        self.client.websocket = FakeSocket()
+        self.client.handle_message = AsyncMock(side_effect=handled.append)
+        self.client._rx = asyncio.Queue()
+        reader = asyncio.create_task(self.client._reader())
+        dispatcher = asyncio.create_task(self.client._dispatcher())
+
+        result = await self.client.send_message_wait_response({"type": "get_config"})
+        frames.put_nowait(None)
+        await asyncio.gather(reader, dispatcher)
+
+        assert result == {"ok": True}
+        assert [msg["type"] for msg in handled] == ["event"]
+        assert self.client._pending == {}
+
     @pytest.mark.asyncio
     async def test_subscribe_events_all(self):
         """Test subscribing to all events."""
@@ -456,6 +556,14 @@ class TestHomeAssistantWebSocketClientAsync:
         assert sent_data["target"]["area_id"] == "kitchen"
         assert "area_id" not in sent_data["service_data"]
 
+    @pytest.mark.asyncio
+    async def test_call_service_legacy_area_id_leaves_caller_data(self):
+        """Legacy extraction should not mutate the caller's service_data."""
+        service_data = {"brightness": 100, "area_id": "kitchen"}
+        await self.client.call_service("light", "turn_on", service_data)
+
+        assert service_data == {"brightness": 100, "area_id": "kitchen"}
+
     @pytest.mark.asyncio
     async def test_call_service_legacy_entity_id(self):
         """Test service call with entity_id in service_data (legacy)."""
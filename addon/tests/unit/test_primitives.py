@@ -103,6 +103,22 @@ class TestMagicLightPrimitives:
         # Should be clamped to 1080 (+18 hours)
         assert self.mock_client.magic_mode_time_offsets[area_id] == 1080
 
+    @pytest.mark.asyncio
+    async def test_step_up_at_bound_skips_state_save(self):
+        """Repeated step_up at the offset bound should not rewrite saved state."""
+        area_id = "test_area"
+        self.mock_client.magic_mode_areas.add(area_id)
+        self.mock_client.magic_mode_time_offsets[area_id] = 1080
+
+        mock_dimming_result = {'time_offset_minutes': 30, 'kelvin': 4000, 'brightness': 85}
+
+        with patch('primitives.calculate_dimming_step', return_value=mock_dimming_result):
+            await self.primitives.step_up(area_id)
+
+        assert self.mock_client.magic_mode_time_offsets[area_id] == 1080
+        self.mock_client.schedule_magic_mode_save.assert_not_called()
+        self.mock_client.turn_on_lights_adaptive.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_step_up_magic_mode_calculation_error(self):
         """Test step_up fallback when calculation fails."""
@@ -237,8 +253,11 @@ class TestMagicLightPrimitives:
 
         assert pytest.approx(self.mock_client.magic_mode_brightness_offsets[area_id], rel=1e-3) == 10
         assert self.mock_client.turn_on_lights_adaptive.await_count == 1
-        _, kwargs = self.mock_client.turn_on_lights_adaptive.call_args
+        args, kwargs = self.mock_client.turn_on_lights_adaptive.call_args
         assert kwargs.get('include_color') is False
+        # 80% base + 10% of the 1-100 span, from a single curve evaluation
+        assert args[1]['brightness'] == 90
+        assert self.mock_client.get_adaptive_lighting_for_area.await_count == 1
 
     @pytest.mark.asyncio
     async def test_dim_down_magic_mode_clamped(self):
@@ -533,7 +552,7 @@ class TestSolarMidnightReset:
             mock_datetime.now.return_value = today
 
             # Mock astral calculations to return predictable solar times
-            with patch('astral.sun.sun') as mock_sun:
+            with patch('main.sun') as mock_sun:
                 solar_noon = today.replace(hour=12, minute=0, second=0)
                 mock_sun.return_value = {"noon": solar_noon}
 
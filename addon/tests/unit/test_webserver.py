@@ -11,6 +11,7 @@ import pytest
 from aiohttp import web
 from aiohttp.test_utils import AioHTTPTestCase, unittest_run_loop
 
+import webserver
 from webserver import LightDesignerServer
 
 
@@ -64,6 +65,17 @@ class TestLightDesignerServer(AioHTTPTestCase):
         data = await resp.json()
         self.assertEqual(data["status"], "healthy")
 
+    @unittest_run_loop
+    async def test_api_with_ingress_path_keeps_query(self):
+        """Test ingress-prefixed API requests reach the plain route with their query."""
+        resp = await self.client.request("GET", "/some/ingress/path/api/steps?hour=6&max_steps=2")
+        self.assertEqual(resp.status, 200)
+        data = await resp.json()
+
+        direct = await self.client.request("GET", "/api/steps?hour=6&max_steps=2")
+        self.assertEqual(data, await direct.json())
+        self.assertLessEqual(len(data["step_up"]["steps"]), 2)
+
     @unittest_run_loop
     async def test_get_config_default(self):
         """Test getting default configuration."""
@@ -154,10 +166,62 @@ class TestLightDesignerServer(AioHTTPTestCase):
         with open(self.designer_file, 'r') as f:
             saved_config = json.load(f)
 
-        # Should include new values plus defaults
-        self.assertEqual(saved_config["mid_bri_up"], 7.0)
-        self.assertEqual(saved_config["steep_bri_dn"], 1.8)
-        self.assertEqual(saved_config["color_mode"], "rgb")
+        # Should include only the values that differ from the defaults
+        self.assertEqual(saved_config, new_config)
+
+    @unittest_run_loop
+    async def test_save_config_keeps_options_precedence(self):
+        """Values matching options.json are not copied into the designer file."""
+        with open(self.options_file, 'w') as f:
+            json.dump({"max_brightness": 90, "color_mode": "xy"}, f)
+
+        resp = await self.client.request("POST", "/api/config", json={"max_brightness": 90, "mid_bri_up": 7.0})
+        self.assertEqual(resp.status, 200)
+
+        with open(self.designer_file, 'r') as f:
+            self.assertEqual(json.load(f), {"mid_bri_up": 7.0})
+
+        resp = await self.client.request("GET", "/api/config")
+        data = await resp.json()
+        self.assertEqual(data["max_brightness"], 90)
+        self.assertEqual(data["color_mode"], "xy")
+        self.assertEqual(data["mid_bri_up"], 7.0)
+
+    @unittest_run_loop
+    async def test_save_config_rejects_oversized_body(self):
+        """Test that bodies over the request size cap are refused without saving."""
+        payload = {"padding": "x" * webserver.MAX_REQUEST_SIZE}
+        resp = await self.client.request("POST", "/api/config", json=payload)
+        self.assertEqual(resp.status, 413)
+        self.assertFalse(os.path.exists(self.designer_file))
+
+    @unittest_run_loop
+    async def test_save_config_primes_cache(self):
+        """A save leaves the merged config cached, so the next GET reads no files."""
+        resp = await self.client.request("POST", "/api/config", json={"max_brightness": 80})
+        self.assertEqual(resp.status, 200)
+
+        with patch("webserver._read_json_files") as mock_read:
+            resp = await self.client.request("GET", "/api/config")
+            data = await resp.json()
+
+        mock_read.assert_not_called()
+        self.assertEqual(data["max_brightness"], 80)
+        self.assertEqual(data["mid_bri_up"], webserver.DESIGNER_DEFAULTS["mid_bri_up"])
+
+    @unittest_run_loop
+    async def test_save_config_replaces_file_atomically(self):
+        """Saving leaves only the final file behind, and a failed write keeps the old one."""
+        await self.light_server.save_config_to_file({"max_brightness": 70})
+        self.assertEqual(os.listdir(self.test_dir), ["designer_config.json"])
+
+        with patch("webserver.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                await self.light_server.save_config_to_file({"max_brightness": 10})
+
+        with open(self.designer_file, 'r') as f:
+            self.assertEqual(json.load(f), {"max_brightness": 70})
+        self.assertEqual(os.listdir(self.test_dir), ["designer_config.json"])
 
     @unittest_run_loop
     async def test_save_config_with_ingress_path(self):
@@ -189,48 +253,49 @@ class TestLightDesignerServer(AioHTTPTestCase):
 </body>
 </html>"""
 
-        # Create async mock for aiofiles
-        class AsyncMockFile:
-            async def __aenter__(self):
-                return self
-            async def __aexit__(self, *args):
-                pass
-            async def read(self):
-                return mock_html
-
-        with patch("aiofiles.open", return_value=AsyncMockFile()):
-            resp = await self.client.request("GET", "/")
-            self.assertEqual(resp.status, 200)
-            content = await resp.text()
-
-            # Should contain the HTML
-            self.assertIn("Light Designer", content)
-            # Should contain injected config script
-            self.assertIn("window.savedConfig", content)
-            self.assertIn("color_mode", content)
-
-            # Check cache headers
-            self.assertEqual(resp.headers.get("Cache-Control"), "no-cache, no-store, must-revalidate")
+        html_path = Path(self.test_dir) / "designer.html"
+        html_path.write_text(mock_html)
+        self.light_server.designer_html = html_path
+
+        resp = await self.client.request("GET", "/")
+        self.assertEqual(resp.status, 200)
+        content = await resp.text()
+
+        # Should serve the HTML unchanged; the page fetches its config itself
+        self.assertEqual(content, mock_html)
+
+        # Check cache headers
+        self.assertEqual(resp.headers.get("Cache-Control"), "no-cache, no-store, must-revalidate")
 
     @unittest_run_loop
     async def test_serve_designer_with_path(self):
         """Test serving designer page with path."""
         mock_html = "<html><body>Test</body></html>"
+        html_path = Path(self.test_dir) / "designer.html"
+        html_path.write_text(mock_html)
+        self.light_server.designer_html = html_path
+
+        resp = await self.client.request("GET", "/some/path")
+        self.assertEqual(resp.status, 200)
+        content = await resp.text()
+        self.assertIn("Test", content)
+
+    @unittest_run_loop
+    async def test_serve_designer_serves_edited_page(self):
+        """Edits to the page are served without a restart."""
+        html_path = Path(self.test_dir) / "designer.html"
+        html_path.write_text("<html><body>First</body></html>")
+        self.light_server.designer_html = html_path
 
-        # Create async mock for aiofiles
-        class AsyncMockFile:
-            async def __aenter__(self):
-                return self
-            async def __aexit__(self, *args):
-                pass
-            async def read(self):
-                return mock_html
-
-        with patch("aiofiles.open", return_value=AsyncMockFile()):
-            resp = await self.client.request("GET", "/some/path")
-            self.assertEqual(resp.status, 200)
-            content = await resp.text()
-            self.assertIn("Test", content)
+        resp = await self.client.request("GET", "/")
+        self.assertIn("First", await resp.text())
+
+        html_path.write_text("<html><body>Second</body></html>")
+        stat = html_path.stat()
+        os.utime(html_path, (stat.st_atime, stat.st_mtime + 5))
+
+        resp = await self.client.request("GET", "/")
+        self.assertIn("Second", await resp.text())
 
     def test_init_development_mode(self):
         """Test initialization in development mode."""
@@ -267,6 +332,35 @@ class TestLightDesignerServer(AioHTTPTestCase):
         self.assertEqual(config["color_mode"], "kelvin")
         self.assertEqual(config["min_color_temp"], 500)
 
+    @unittest_run_loop
+    async def test_load_config_cached_until_files_change(self):
+        """Unchanged files are not re-read; edits and caller mutations are handled."""
+        with open(self.designer_file, 'w') as f:
+            json.dump({"max_brightness": 80}, f)
+
+        server = self.light_server
+        clock = [100.0]
+        with patch("webserver._read_json_files", wraps=webserver._read_json_files) as reader, \
+                patch("webserver.time.monotonic", side_effect=lambda: clock[0]), \
+                patch.object(server, "_config_signature", wraps=server._config_signature) as signature:
+            first = await server.load_config()
+            first["max_brightness"] = 1  # caller-side edits must not leak into the cache
+            second = await server.load_config()
+            self.assertEqual(reader.call_count, 1)
+            self.assertEqual(signature.call_count, 1)  # no stat within the recheck interval
+            self.assertEqual(second["max_brightness"], 80)
+
+            clock[0] += webserver.CONFIG_RECHECK_INTERVAL
+
+            with open(self.designer_file, 'w') as f:
+                json.dump({"max_brightness": 90}, f)
+            stat = os.stat(self.designer_file)
+            os.utime(self.designer_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+            third = await server.load_config()
+            self.assertEqual(reader.call_count, 2)
+            self.assertEqual(third["max_brightness"], 90)
+
     @unittest_run_loop
     async def test_save_config_file_error(self):
         """Test configuration saving with file errors."""
@@ -298,9 +392,10 @@ class TestLightDesignerServerIntegration:
         # Check that expected routes exist
         route_paths = [path for method, path in routes]
 
-        # API routes with ingress support
-        assert "/{path}/api/config" in route_paths or "/{path:.*}/api/config" in route_paths
-        assert "/{path}/health" in route_paths or "/{path:.*}/health" in route_paths
+        # Ingress prefixes are stripped by middleware, not matched by regex routes
+        assert "/{path}/api/config" not in route_paths
+        assert "/{path}/health" not in route_paths
+        assert webserver.strip_ingress_prefix in server.app.middlewares
 
         # Direct API routes
         assert "/api/config" in route_paths
@@ -262,9 +262,56 @@ class TestZHAParity:
         assert "Room 1" in zigbee_controller.area_to_group_id
 
 
+class TestParityCacheRefresh:
+    """Test rebuilding of the client's area parity cache."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_skips_rebuild_when_inputs_unchanged(self, tmp_path, monkeypatch):
+        """An identical areas snapshot should leave the cache untouched."""
+        client = HomeAssistantWebSocketClient("localhost", 8123, "test_token")
+        monkeypatch.setattr(client, "_get_data_directory", lambda: str(tmp_path))
+        client.light_controller = MagicMock()
+        client.light_controller.controllers = {Protocol.ZIGBEE: MagicMock()}
+        areas = {
+            "kitchen": {"name": "Kitchen", "zha_lights": ["light.a"], "non_zha_lights": []},
+            "office": {"name": "Office", "zha_lights": ["light.b"], "non_zha_lights": ["light.c"]},
+        }
+
+        await client.refresh_area_parity_cache(areas_data=areas)
+        assert client.area_parity_cache == {"kitchen": True, "office": False}
+
+        first_cache = dict(client.area_parity_cache)
+        client.area_parity_cache["kitchen"] = "sentinel"
+        await client.refresh_area_parity_cache(areas_data=dict(areas))
+        assert client.area_parity_cache["kitchen"] == "sentinel"
+
+        areas["office"] = {"name": "Office", "zha_lights": ["light.b"], "non_zha_lights": []}
+        await client.refresh_area_parity_cache(areas_data=areas)
+        assert client.area_parity_cache == {**first_cache, "office": True}
+
+    @pytest.mark.asyncio
+    async def test_parity_cache_persists_across_clients(self, tmp_path, monkeypatch):
+        """A rebuilt parity cache should be restorable by the next client."""
+        client = HomeAssistantWebSocketClient("localhost", 8123, "test_token")
+        monkeypatch.setattr(client, "_get_data_directory", lambda: str(tmp_path))
+        client.light_controller = MagicMock()
+        client.light_controller.controllers = {Protocol.ZIGBEE: MagicMock()}
+        areas = {
+            "kitchen": {"name": "Kitchen", "zha_lights": ["light.a"], "non_zha_lights": []},
+            "office": {"name": "Office", "zha_lights": [], "non_zha_lights": ["light.c"]},
+        }
+        await client.refresh_area_parity_cache(areas_data=areas)
+
+        restored = HomeAssistantWebSocketClient("localhost", 8123, "test_token")
+        monkeypatch.setattr(restored, "_get_data_directory", lambda: str(tmp_path))
+        restored._load_area_parity_cache()
+
+        assert restored.area_parity_cache == {"kitchen": True, "office": False}
+
+
 class TestControlMethodSelection:
     """Test control method selection based on ZHA parity."""
-    
+
     @pytest.mark.asyncio
     async def test_turn_on_lights_uses_zha_for_parity_area(self):
         """Test that areas with ZHA parity use ZHA group control."""
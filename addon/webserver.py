@@ -6,19 +6,150 @@ import json
 import logging
 import math
 import os
+import time
+from bisect import bisect_left
 from aiohttp import web
 from aiohttp.web import Request, Response
-import aiofiles
+from multidict import CIMultiDict, CIMultiDictProxy
 from pathlib import Path
 from datetime import datetime, timedelta
+from typing import Optional
 from zoneinfo import ZoneInfo
 from astral import LocationInfo
 from astral.sun import sun
 
-from brain import DEFAULT_MAX_DIM_STEPS, calculate_dimming_step, get_adaptive_lighting, AdaptiveLighting
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used when unavailable
+    orjson = None
+
+from event_loop import run_with_best_loop
+from brain import (
+    DEFAULT_MAX_DIM_STEPS,
+    calculate_dimming_step,
+    get_adaptive_lighting,
+    get_adaptive_lighting_batch,
+    AdaptiveLighting,
+)
 
 logger = logging.getLogger(__name__)
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Designer config defaults used by the UI when nothing has been saved yet;
+# load_config layers options.json and designer_config.json on a copy.
+DESIGNER_DEFAULTS = {
+    "color_mode": "kelvin",
+    "min_color_temp": 500,
+    "max_color_temp": 6500,
+    "min_brightness": 1,
+    "max_brightness": 100,
+    # Morning (up) parameters - simplified, no gain/offset/decay
+    "mid_bri_up": 6.0,
+    "steep_bri_up": 1.5,
+    "mid_cct_up": 6.0,
+    "steep_cct_up": 1.5,
+    # Evening (down) parameters - simplified, no gain/offset/decay
+    "mid_bri_dn": 8.0,
+    "steep_bri_dn": 1.3,
+    "mid_cct_dn": 8.0,
+    "steep_cct_dn": 1.3,
+    # Mirror flags (default ON)
+    "mirror_up": True,
+    "mirror_dn": True,
+    # Dimming steps
+    "max_dim_steps": DEFAULT_MAX_DIM_STEPS,
+    # Location settings (UI preview only)
+    "latitude": 35.0,
+    "longitude": -78.6,
+    "timezone": "US/Eastern",
+    "month": 6,
+}
+
+
+# The designer page must always be refetched so UI updates show up immediately
+# (built as a CIMultiDict once; aiohttp copies it into each response)
+NO_CACHE_HEADERS = CIMultiDictProxy(CIMultiDict([
+    ('Cache-Control', 'no-cache, no-store, must-revalidate'),
+    ('Pragma', 'no-cache'),
+    ('Expires', '0'),
+]))
+
+
+# Seconds between stat checks of the config files while the merged config is cached;
+# saves through the API refresh the cache immediately
+CONFIG_RECHECK_INTERVAL = 2.0
+
+# Largest request body accepted; a designer config POST is a few KB
+MAX_REQUEST_SIZE = 64 * 1024
+
+# Constant /health response, encoded once
+HEALTHY_BODY = json.dumps({"status": "healthy"}).encode('utf-8')
+
+# API paths the designer calls relative to its ingress URL, e.g. /<prefix>/api/config
+INGRESS_API_PATHS = ('/api/config', '/api/steps', '/api/curve', '/api/time', '/health')
+
+
+@web.middleware
+async def strip_ingress_prefix(request: Request, handler):
+    """Dispatch ingress-prefixed API requests to their plain routes.
+
+    Only plain paths are registered, so a request such as
+    ``/some/prefix/api/config`` first resolves to the designer catch-all; it is
+    re-resolved here against the unprefixed path instead.
+    """
+    path = request.path
+    if path.endswith(INGRESS_API_PATHS) and path not in INGRESS_API_PATHS:
+        for api_path in INGRESS_API_PATHS:
+            if path.endswith(api_path):
+                rel_url = request.rel_url.with_path(api_path).with_query(request.rel_url.query)
+                request = request.clone(rel_url=rel_url)
+                match_info = await request.app.router.resolve(request)
+                return await match_info.handler(request)
+    return await handler(request)
+
+
+def _read_json_files(paths):
+    """Read and parse several JSON files in one go; run via asyncio.to_thread.
+
+    Returns one (data, error) pair per path. Missing files yield (None, None)
+    so a single executor hop serves every config file.
+    """
+    results = []
+    for path in paths:
+        try:
+            with open(path, 'rb') as f:
+                results.append((_json_loads(f.read()), None))
+        except FileNotFoundError:
+            results.append((None, None))
+        except Exception as e:
+            results.append((None, e))
+    return results
+
+
+def _atomic_write_json(path: str, data: dict) -> None:
+    """Write JSON to path via a fsynced temp file and os.replace; run via asyncio.to_thread.
+
+    Readers see either the old or the new file, never a partial write.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 def calculate_step_sequence(current_hour: float, action: str, max_steps: int, config: dict) -> list:
     """Calculate a sequence of step positions for visualization.
@@ -49,7 +180,9 @@ def calculate_step_sequence(current_hour: float, action: str, max_steps: int, co
     except:
         tzinfo = ZoneInfo('UTC')
 
-    today = datetime.now(tzinfo).date()
+    # One clock read serves both the solar date and the midnight base below
+    now = datetime.now(tzinfo)
+    today = now.date()
     loc = LocationInfo(latitude=latitude, longitude=longitude, timezone=tzinfo)
     solar_events = sun(loc.observer, date=today, tzinfo=tzinfo)
     solar_noon = solar_events["noon"]
@@ -57,7 +190,7 @@ def calculate_step_sequence(current_hour: float, action: str, max_steps: int, co
 
     # Convert clock hour (0-24) to actual datetime
     # current_hour is now clock time (0 = midnight, 12 = noon, etc.)
-    base_time = datetime.now(tzinfo).replace(hour=0, minute=0, second=0, microsecond=0)
+    base_time = now.replace(hour=0, minute=0, second=0, microsecond=0)
     adjusted_time = base_time + timedelta(hours=current_hour)
 
     try:
@@ -114,9 +247,9 @@ def calculate_step_sequence(current_hour: float, action: str, max_steps: int, co
                 current_hour = new_hour
 
     except Exception as e:
-        logger.error(f"Error calculating step sequence: {e}")
-        logger.error(f"Config: {config}")
-        logger.error(f"Current hour: {current_hour}, action: {action}, max_steps: {max_steps}")
+        logger.error("Error calculating step sequence: %s", e)
+        logger.error("Config: %s", config)
+        logger.error("Current hour: %s, action: %s, max_steps: %s", current_hour, action, max_steps)
         # Return at least the first step if possible
         if not steps:
             try:
@@ -135,7 +268,7 @@ def calculate_step_sequence(current_hour: float, action: str, max_steps: int, co
                     'rgb': lighting_values.get('rgb', [255, 255, 255])
                 })
             except Exception as e2:
-                logger.error(f"Error getting current position: {e2}")
+                logger.error("Error getting current position: %s", e2)
 
     return steps
 
@@ -163,7 +296,8 @@ def generate_curve_data(config: dict) -> dict:
             tzinfo = ZoneInfo('UTC')
 
         # Use current date but for the specified test month
-        today = datetime.now(tzinfo).replace(month=month, day=15)  # Mid-month for consistency
+        now = datetime.now(tzinfo)
+        today = now.replace(month=month, day=15)  # Mid-month for consistency
         loc = LocationInfo(latitude=latitude, longitude=longitude, timezone=tzinfo)
         solar_events = sun(loc.observer, date=today.date(), tzinfo=tzinfo)
 
@@ -175,78 +309,47 @@ def generate_curve_data(config: dict) -> dict:
 
         # Sample at 0.1 hour intervals (matching JavaScript)
         sample_step = 0.1
-        hours = []
-        brightness_values = []
-        cct_values = []
-        rgb_values = []
-        sun_power_values = []
-
-        # Morning segment (solar midnight to solar noon)
-        morning_hours = []
-        morning_brightness = []
-        morning_cct = []
-
-        # Evening segment (solar noon to solar midnight)
-        evening_hours = []
-        evening_brightness = []
-        evening_cct = []
 
         # Sample the full 24-hour curve using actual clock time
         # Start from midnight of today and sample every 0.1 hours
-        base_time = datetime.now(tzinfo).replace(hour=0, minute=0, second=0, microsecond=0)
-
-        for i in range(int(24 / sample_step)):
-            current_time = base_time + timedelta(hours=i * sample_step)
-
-            # Calculate hour of day (0-24 scale) for plotting
-            clock_hour = current_time.hour + current_time.minute / 60.0
-
-            # Get adaptive lighting values using the main function
-            lighting_values = get_adaptive_lighting(
-                latitude=latitude,
-                longitude=longitude,
-                timezone=timezone,
-                current_time=current_time,
-                min_color_temp=config.get('min_color_temp', 500),
-                max_color_temp=config.get('max_color_temp', 6500),
-                min_brightness=config.get('min_brightness', 1),
-                max_brightness=config.get('max_brightness', 100),
-                config=config
-            )
-
-            brightness = lighting_values['brightness']
-            cct = lighting_values['kelvin']
-            rgb = lighting_values.get('rgb', [255, 255, 255])
-
-            # Calculate sun power (simple approximation based on time)
-            # This is just for visualization - using a simple sine wave approximation
-            hour_of_day = current_time.hour + current_time.minute / 60
-            if 6 <= hour_of_day <= 18:  # Daytime hours
-                sun_power = max(0, 300 * math.sin(math.pi * (hour_of_day - 6) / 12))
-            else:
-                sun_power = 0
-
-            # Add to main arrays
-            hours.append(clock_hour)
-            brightness_values.append(brightness)
-            cct_values.append(cct)
-            rgb_values.append(list(rgb))
-            sun_power_values.append(sun_power)
-
-            # Add to appropriate segment (split at solar noon, not clock noon)
-            # Convert solar noon to clock time for proper segmentation
-            solar_noon_clock = solar_noon.hour + solar_noon.minute / 60.0
-            if clock_hour < solar_noon_clock:
-                morning_hours.append(clock_hour)
-                morning_brightness.append(brightness)
-                morning_cct.append(cct)
-            else:
-                evening_hours.append(clock_hour)
-                evening_brightness.append(brightness)
-                evening_cct.append(cct)
+        base_time = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        step_minutes = int(round(sample_step * 60))
+        sample_minutes = range(0, 24 * 60, step_minutes)
+        sample_times = [base_time + timedelta(minutes=m) for m in sample_minutes]
+
+        # Evaluate the whole curve in one call so solar events are computed once
+        samples = get_adaptive_lighting_batch(
+            sample_times,
+            latitude=latitude,
+            longitude=longitude,
+            timezone=timezone,
+            min_color_temp=config.get('min_color_temp', 500),
+            max_color_temp=config.get('max_color_temp', 6500),
+            min_brightness=config.get('min_brightness', 1),
+            max_brightness=config.get('max_brightness', 100),
+            config=config
+        )
+
+        # Build each column in one pass; hours are wall-clock offsets from midnight,
+        # so no datetime fields are needed
+        hours = [m // 60 + (m % 60) / 60.0 for m in sample_minutes]
+        brightness_values = [values['brightness'] for values in samples]
+        cct_values = [values['kelvin'] for values in samples]
+
+        # Calculate sun power (simple approximation based on time)
+        # This is just for visualization - using a simple sine wave approximation
+        sun_power_values = [
+            max(0, 300 * math.sin(math.pi * (hour - 6) / 12)) if 6 <= hour <= 18 else 0
+            for hour in hours
+        ]
 
-            # Move to next sample point
-            current_time += timedelta(hours=sample_step)
+        # Split at solar noon (not clock noon); hours are ascending, so the
+        # morning segment is everything before the first sample at/after noon
+        solar_noon_clock = solar_noon.hour + solar_noon.minute / 60.0
+        split = bisect_left(hours, solar_noon_clock)
+        morning_hours, evening_hours = hours[:split], hours[split:]
+        morning_brightness, evening_brightness = brightness_values[:split], brightness_values[split:]
+        morning_cct, evening_cct = cct_values[:split], cct_values[split:]
 
         # Convert solar times to clock hours (0-24 scale)
         solar_noon_hour = solar_noon.hour + solar_noon.minute / 60.0
@@ -288,7 +391,7 @@ def generate_curve_data(config: dict) -> dict:
         }
 
     except Exception as e:
-        logger.error(f"Error generating curve data: {e}")
+        logger.error("Error generating curve data: %s", e)
         # Return minimal valid structure on error
         return {
             'hours': [0, 12, 24],
@@ -306,7 +409,7 @@ class LightDesignerServer:
     
     def __init__(self, port: int = 8099):
         self.port = port
-        self.app = web.Application()
+        self.app = web.Application(middlewares=[strip_ingress_prefix], client_max_size=MAX_REQUEST_SIZE)
         self.setup_routes()
         
         # Detect environment and set appropriate paths
@@ -324,18 +427,20 @@ class LightDesignerServer:
         # Set file paths based on data directory
         self.options_file = os.path.join(self.data_dir, "options.json")
         self.designer_file = os.path.join(self.data_dir, "designer_config.json")
+
+        # Static designer page
+        self.designer_html = Path(__file__).parent / "designer.html"
+
+        # Merged config from the last load, keyed by the config files' stat signature
+        self._config_cache: Optional[dict] = None
+        self._config_key: Optional[tuple] = None
+        self._config_baseline: dict = {}  # defaults + options.json, without designer overrides
+        self._config_checked_at = 0.0  # time.monotonic() of the last signature check
+        self._config_body: Optional[bytes] = None  # JSON encoding of _config_cache
         
     def setup_routes(self):
         """Set up web routes."""
-        # API routes - must handle all ingress prefixes
-        self.app.router.add_route('GET', '/{path:.*}/api/config', self.get_config)
-        self.app.router.add_route('POST', '/{path:.*}/api/config', self.save_config)
-        self.app.router.add_route('GET', '/{path:.*}/api/steps', self.get_step_sequences)
-        self.app.router.add_route('GET', '/{path:.*}/api/curve', self.get_curve_data)
-        self.app.router.add_route('GET', '/{path:.*}/api/time', self.get_time)
-        self.app.router.add_route('GET', '/{path:.*}/health', self.health_check)
-
-        # Direct API routes (for non-ingress access)
+        # API routes; ingress-prefixed paths are mapped onto these by strip_ingress_prefix
         self.app.router.add_get('/api/config', self.get_config)
         self.app.router.add_post('/api/config', self.save_config)
         self.app.router.add_get('/api/steps', self.get_step_sequences)
@@ -348,79 +453,59 @@ class LightDesignerServer:
         self.app.router.add_get('/{path:.*}', self.serve_designer)
         
     async def serve_designer(self, request: Request) -> Response:
-        """Serve the Light Designer HTML page."""
-        try:
-            # Read the current configuration (merged options + designer overrides)
-            config = await self.load_config()
-            
-            # Read the designer HTML template
-            html_path = Path(__file__).parent / "designer.html"
-            async with aiofiles.open(html_path, 'r') as f:
-                html_content = await f.read()
-            
-            # Inject current configuration into the HTML
-            config_script = f"""
-            <script>
-            // Load saved configuration
-            window.savedConfig = {json.dumps(config)};
-            </script>
-            """
-            
-            # Insert the config script before the closing body tag
-            html_content = html_content.replace('</body>', f'{config_script}</body>')
-            
-            return web.Response(
-                text=html_content, 
-                content_type='text/html',
-                headers={
-                    'Cache-Control': 'no-cache, no-store, must-revalidate',
-                    'Pragma': 'no-cache',
-                    'Expires': '0'
-                }
-            )
-        except Exception as e:
-            logger.error(f"Error serving designer page: {e}")
-            return web.Response(text=f"Error: {str(e)}", status=500)
-    
+        """Serve the Light Designer HTML page.
+
+        The page is static (it fetches ``api/config`` itself), so it is sent
+        straight from disk with sendfile where the platform supports it.
+        """
+        return web.FileResponse(self.designer_html, headers=NO_CACHE_HEADERS)
+
     async def get_config(self, request: Request) -> Response:
         """Get current curve configuration."""
         try:
-            config = await self.load_config()
-            return web.json_response(config)
+            body = await self._get_config_body()
+            return web.Response(body=body, content_type='application/json')
         except Exception as e:
-            logger.error(f"Error getting config: {e}")
+            logger.error("Error getting config: %s", e)
             return web.json_response({"error": str(e)}, status=500)
     
     async def save_config(self, request: Request) -> Response:
         """Save curve configuration."""
         try:
-            data = await request.json()
+            data = await request.json(loads=_json_loads)
             
-            # Load existing config
+            # Merge onto the cached config (read from disk only when cold)
             config = await self.load_config()
-            
-            # Update with new curve parameters
             config.update(data)
             
-            # Save to file
-            await self.save_config_to_file(config)
+            # Persist only what differs from defaults + options.json, so options
+            # keep their precedence for keys the designer never changed
+            baseline = self._config_baseline
+            overlay = {key: value for key, value in config.items()
+                       if key not in baseline or baseline[key] != value}
+            await self.save_config_to_file(overlay)
+
+            # baseline + overlay is exactly the merge, so it becomes the new cache
+            # directly instead of being re-read on the next request
+            self._config_cache = config
+            self._config_key = self._config_signature()
+            self._config_checked_at = time.monotonic()
             
             return web.json_response({"status": "success", "config": config})
+        except web.HTTPException:
+            # e.g. 413 for bodies over MAX_REQUEST_SIZE
+            raise
         except Exception as e:
-            logger.error(f"Error saving config: {e}")
+            logger.error("Error saving config: %s", e)
             return web.json_response({"error": str(e)}, status=500)
     
     async def health_check(self, request: Request) -> Response:
         """Health check endpoint."""
-        return web.json_response({"status": "healthy"})
+        return web.Response(body=HEALTHY_BODY, content_type='application/json')
 
     async def get_time(self, request: Request) -> Response:
         """Get current server time in Home Assistant timezone."""
         try:
-            from datetime import datetime
-            from zoneinfo import ZoneInfo
-            from brain import get_adaptive_lighting
-
             # Get location from environment variables (set by main.py)
             latitude = float(os.getenv("HASS_LATITUDE", "35.0"))
             longitude = float(os.getenv("HASS_LONGITUDE", "-78.6"))
@@ -467,7 +552,7 @@ class LightDesignerServer:
             })
 
         except Exception as e:
-            logger.error(f"Error getting time info: {e}")
+            logger.error("Error getting time info: %s", e)
             return web.json_response(
                 {"error": f"Failed to get time info: {e}"},
                 status=500
@@ -492,7 +577,7 @@ class LightDesignerServer:
                     else:
                         config[param_name] = float(raw_value)
                 except (ValueError, TypeError):
-                    logger.warning(f"Invalid value for {param_name}: {raw_value}")
+                    logger.warning("Invalid value for %s: %s", param_name, raw_value)
 
         for param_name in ['mirror_up', 'mirror_dn']:
             if param_name in query:
@@ -523,7 +608,7 @@ class LightDesignerServer:
             })
 
         except Exception as e:
-            logger.error(f"Error calculating step sequences: {e}")
+            logger.error("Error calculating step sequences: %s", e)
             return web.json_response({"error": str(e)}, status=500)
 
     async def get_curve_data(self, request: Request) -> Response:
@@ -541,76 +626,80 @@ class LightDesignerServer:
             return web.json_response(curve_data)
 
         except Exception as e:
-            logger.error(f"Error generating curve data: {e}")
+            logger.error("Error generating curve data: %s", e)
             return web.json_response({"error": str(e)}, status=500)
 
+    def _config_signature(self) -> tuple:
+        """Stat signature of the config files; changes whenever either is rewritten."""
+        signature = []
+        for path in (self.options_file, self.designer_file):
+            try:
+                st = os.stat(path)
+                signature.append((path, st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append((path, None, None))
+        return tuple(signature)
+
     async def load_config(self) -> dict:
         """Load configuration, merging HA options with designer overrides.
 
         Order of precedence (later wins):
           defaults -> options.json -> designer_config.json
-        """
-        # Defaults used by UI when nothing saved yet
-        config: dict = {
-            "color_mode": "kelvin",
-            "min_color_temp": 500,
-            "max_color_temp": 6500,
-            "min_brightness": 1,
-            "max_brightness": 100,
-            # Morning (up) parameters - simplified, no gain/offset/decay
-            "mid_bri_up": 6.0,
-            "steep_bri_up": 1.5,
-            "mid_cct_up": 6.0,
-            "steep_cct_up": 1.5,
-            # Evening (down) parameters - simplified, no gain/offset/decay
-            "mid_bri_dn": 8.0,
-            "steep_bri_dn": 1.3,
-            "mid_cct_dn": 8.0,
-            "steep_cct_dn": 1.3,
-            # Mirror flags (default ON)
-            "mirror_up": True,
-            "mirror_dn": True,
-            # Dimming steps
-            "max_dim_steps": DEFAULT_MAX_DIM_STEPS,
-            # Location settings (UI preview only)
-            "latitude": 35.0,
-            "longitude": -78.6,
-            "timezone": "US/Eastern",
-            "month": 6
-        }
 
-        # Merge supervisor-managed options.json (if present)
-        try:
-            if os.path.exists(self.options_file):
-                async with aiofiles.open(self.options_file, 'r') as f:
-                    content = await f.read()
-                    opts = json.loads(content)
-                    if isinstance(opts, dict):
-                        config.update(opts)
-        except Exception as e:
-            logger.warning(f"Error loading {self.options_file}: {e}")
-
-        # Merge user-saved designer config (persists across restarts)
-        try:
-            if os.path.exists(self.designer_file):
-                async with aiofiles.open(self.designer_file, 'r') as f:
-                    content = await f.read()
-                    overrides = json.loads(content)
-                    if isinstance(overrides, dict):
-                        config.update(overrides)
-        except Exception as e:
-            logger.warning(f"Error loading {self.designer_file}: {e}")
+        Returns a copy of the cached merge, since several callers modify it.
+        """
+        return dict(await self._get_merged_config())
+
+    async def _get_config_body(self) -> bytes:
+        """Return the merged config encoded as JSON, reusing the last encoding."""
+        config = await self._get_merged_config()
+        if self._config_body is None:
+            self._config_body = json.dumps(config).encode('utf-8')
+        return self._config_body
+
+    async def _get_merged_config(self) -> dict:
+        """Return the shared merged config, rebuilding it only when a config file changed."""
+        # Within the recheck interval the cache is trusted without any stat calls
+        now = time.monotonic()
+        if self._config_cache is not None and now - self._config_checked_at < CONFIG_RECHECK_INTERVAL:
+            return self._config_cache
+
+        key = self._config_signature()
+        self._config_checked_at = now
+        if self._config_cache is not None and key == self._config_key:
+            return self._config_cache
 
+        # Defaults used by UI when nothing saved yet
+        config = dict(DESIGNER_DEFAULTS)
+
+        # Merge supervisor-managed options.json, then user-saved designer config
+        # (persists across restarts); both are read in a single worker-thread job
+        paths = (self.options_file, self.designer_file)
+        results = await asyncio.to_thread(_read_json_files, paths)
+        for path, (data, error) in zip(paths, results):
+            if path == self.designer_file:
+                baseline = dict(config)
+            if error is not None:
+                logger.warning("Error loading %s: %s", path, error)
+            elif isinstance(data, dict):
+                config.update(data)
+
+        self._config_baseline = baseline
+        self._config_cache = config
+        self._config_key = key
+        self._config_body = None
         return config
     
     async def save_config_to_file(self, config: dict):
         """Save designer configuration to persistent file distinct from options.json."""
         try:
-            async with aiofiles.open(self.designer_file, 'w') as f:
-                await f.write(json.dumps(config, indent=2))
-            logger.info(f"Configuration saved to {self.designer_file}")
+            await asyncio.to_thread(_atomic_write_json, self.designer_file, config)
+            # Drop the merged cache rather than trusting mtime resolution
+            self._config_cache = None
+            self._config_body = None
+            logger.info("Configuration saved to %s", self.designer_file)
         except Exception as e:
-            logger.error(f"Error saving config to file: {e}")
+            logger.error("Error saving config to file: %s", e)
             raise
     
     async def start(self):
@@ -641,4 +730,5 @@ async def main():
     await server.start()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Same loop choice as main.py: uvloop trims per-request dispatch overhead
+    run_with_best_loop(main())